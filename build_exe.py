@@ -1,19 +1,29 @@
 #!/usr/bin/env python3
 """Build script to create Windows executable from prep.py using PyInstaller."""
 
+import argparse
 import os
 import sys
 import subprocess
 from pathlib import Path
 
 
-def install_pyinstaller():
-    """Install PyInstaller if not already installed."""
+def install_pyinstaller(install_deps=False):
+    """Install PyInstaller if it is missing and installing is allowed.
+    
+    Installing is allowed with --install-deps, or when running
+    interactively; otherwise a missing PyInstaller is reported as an error.
+    """
     try:
         import PyInstaller
         print("PyInstaller is already installed.")
         return True
     except ImportError:
+        if not install_deps and not sys.stdin.isatty():
+            print("PyInstaller not found. Install it with 'pip install pyinstaller' "
+                  "or rerun with --install-deps.")
+            return False
+        
         print("PyInstaller not found. Installing...")
         try:
             subprocess.check_call([sys.executable, "-m", "pip", "install", "pyinstaller"])
@@ -32,7 +42,7 @@ def build_executable():
     
     # PyInstaller command with options
     cmd = [
-        "pyinstaller",
+        sys.executable, "-m", "PyInstaller",
         "--onefile",           # Create a single executable file
         "--console",           # Keep console window (for command-line tool)
         "--name", "prep",      # Name of the executable
@@ -41,8 +51,11 @@ def build_executable():
         "--specpath", ".",     # Location for .spec file
         "--clean",             # Clean PyInstaller cache before building
         "--noconfirm",         # Replace output directory without confirmation
-        "prep.py"              # Main Python script
+        "--noupx",             # Skip UPX so the executable starts without unpacking
     ]
+    if sys.platform != "win32":
+        cmd.append("--strip")  # Strip symbols from binaries (not supported on Windows)
+    cmd.append("prep.py")      # Main Python script
     
     print("Building Windows executable...")
     print(f"Command: {' '.join(cmd)}")
@@ -74,6 +87,14 @@ def build_executable():
 
 def main():
     """Main build function."""
+    parser = argparse.ArgumentParser(description="Build the prep executable with PyInstaller.")
+    parser.add_argument(
+        "--install-deps",
+        action="store_true",
+        help="Install PyInstaller with pip if it is missing",
+    )
+    args = parser.parse_args()
+    
     print("=== Windows Executable Builder for prep ===\n")
     
     # Check if we're on Windows (optional - PyInstaller works on other platforms too)
@@ -82,7 +103,7 @@ def main():
         print("Note: Building on non-Windows platform. The executable will still be for Windows.")
     
     # Install PyInstaller if needed
-    if not install_pyinstaller():
+    if not install_pyinstaller(args.install_deps):
         print("Cannot proceed without PyInstaller.")
         return 1
     
@@ -1,52 +1,116 @@
 """Main CLI application for prep."""
 
+import os
+import stat
 import sys
-from typing import List, Optional
-from pathlib import Path
+from functools import cached_property
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional
 
 from .argument_parser import PrepArgumentParser
 from ..usecases.search_usecase import SearchUseCase, CountUseCase, QuietUseCase
-from ..usecases.file_watch_usecase import FileWatchUseCase, FileWatchCountUseCase, FileWatchQuietUseCase
-from ..infrastructure.file_operations import StandardFileReader, StandardFileScanner
+from ..infrastructure.file_operations import MmapFileReader, StandardFileScanner
 from ..infrastructure.pattern_matching import HybridPatternMatcher
 from ..infrastructure.output_formatting import StandardOutputFormatter
-from ..infrastructure.parallel_execution import AdaptiveExecutor
-from ..infrastructure.file_watcher import StandardFileWatcher
-from ..domain.models import SearchOptions
+from ..domain.models import MatchResult, SearchOptions
 
 
 class PrepApplication:
-    """Main application class for prep CLI."""
+    """Main application class for prep CLI.
+    
+    Components are created on first use, so a plain one-shot search never
+    pays for the file watching subsystem or for process pools.
+    """
+    
+    # Output lines encoded and written per batch
+    OUTPUT_BATCH_LINES = 4096
     
     def __init__(self):
         self.arg_parser = PrepArgumentParser()
+    
+    # Infrastructure components
+    
+    @cached_property
+    def file_reader(self) -> MmapFileReader:
+        """File reader used by searches."""
+        return MmapFileReader()
+    
+    @cached_property
+    def file_scanner(self) -> StandardFileScanner:
+        """Scanner expanding paths into files."""
+        return StandardFileScanner()
+    
+    @cached_property
+    def pattern_matcher(self) -> HybridPatternMatcher:
+        """Matcher shared by search and watch modes."""
+        return HybridPatternMatcher()
+    
+    @cached_property
+    def output_formatter(self) -> StandardOutputFormatter:
+        """Formatter for search results."""
+        return StandardOutputFormatter()
+    
+    @cached_property
+    def parallel_executor(self):
+        """Executor for multi-file searches."""
+        from ..infrastructure.parallel_execution import AdaptiveExecutor
+        return AdaptiveExecutor()
+    
+    @cached_property
+    def file_watcher(self):
+        """Watcher for -f/--follow mode."""
+        from ..infrastructure.native_watcher import LinuxInotifyWatcher
+        if LinuxInotifyWatcher.is_supported():
+            return LinuxInotifyWatcher()
         
-        # Initialize infrastructure components
-        self.file_reader = StandardFileReader()
-        self.file_scanner = StandardFileScanner()
-        self.pattern_matcher = HybridPatternMatcher()
-        self.output_formatter = StandardOutputFormatter()
-        self.parallel_executor = AdaptiveExecutor()
-        self.file_watcher = StandardFileWatcher()
-        
-        # Initialize use cases
-        self.search_usecase = SearchUseCase(
+        from ..infrastructure.file_watcher import StandardFileWatcher
+        return StandardFileWatcher()
+    
+    # Search use cases
+    
+    @cached_property
+    def search_usecase(self) -> SearchUseCase:
+        """Use case for regular searches."""
+        return SearchUseCase(
             file_reader=self.file_reader,
             file_scanner=self.file_scanner,
             pattern_matcher=self.pattern_matcher,
             parallel_executor=self.parallel_executor
         )
-        self.count_usecase = CountUseCase(self.search_usecase)
-        self.quiet_usecase = QuietUseCase(self.search_usecase)
-        
-        # Initialize file watching use cases
-        self.file_watch_usecase = FileWatchUseCase(
+    
+    @cached_property
+    def count_usecase(self) -> CountUseCase:
+        """Use case for -c searches."""
+        return CountUseCase(self.search_usecase)
+    
+    @cached_property
+    def quiet_usecase(self) -> QuietUseCase:
+        """Use case for -q searches."""
+        return QuietUseCase(self.search_usecase)
+    
+    # File watching use cases
+    
+    @cached_property
+    def file_watch_usecase(self):
+        """Use case for -f searches."""
+        from ..usecases.file_watch_usecase import FileWatchUseCase
+        return FileWatchUseCase(
             file_watcher=self.file_watcher,
             pattern_matcher=self.pattern_matcher,
             output_formatter=self.output_formatter
         )
-        self.file_watch_count_usecase = FileWatchCountUseCase(self.file_watch_usecase)
-        self.file_watch_quiet_usecase = FileWatchQuietUseCase(self.file_watch_usecase)
+    
+    @cached_property
+    def file_watch_count_usecase(self):
+        """Use case for -f -c searches."""
+        from ..usecases.file_watch_usecase import FileWatchCountUseCase
+        return FileWatchCountUseCase(self.file_watch_usecase)
+    
+    @cached_property
+    def file_watch_quiet_usecase(self):
+        """Use case for -f -q searches."""
+        from ..usecases.file_watch_usecase import FileWatchQuietUseCase
+        return FileWatchQuietUseCase(self.file_watch_usecase)
     
     def run(self, args: Optional[List[str]] = None) -> int:
         """Run the prep application and return exit code."""
@@ -81,99 +145,163 @@ class PrepApplication:
             return 0 if found_matches else 1
         elif options.count_only:
             result = self.count_usecase.execute(validated_paths, options)
-            output = self.output_formatter.format_result(result, options)
-            if output:
-                print(output)
+            self._write_lines(self.output_formatter.iter_format_result(result, options))
             return 0 if result.total_matches > 0 else 1
         else:
             result = self.search_usecase.execute(validated_paths, options)
-            output = self.output_formatter.format_result(result, options)
-            if output:
-                print(output)
+            self._write_lines(self.output_formatter.iter_format_result(result, options))
             # Exit-Code-Logik für invert_match
             if options.invert_match:
                 return 0 if result.total_matches > 0 else 1
             return 0 if result.total_matches > 0 else 1
 
+    @classmethod
+    def _write_lines(cls, lines: Iterable[str]) -> None:
+        """Write output lines as they are formatted, in encoded batches.
+        
+        Only one batch is held in memory at a time, and the first lines
+        reach the terminal while later ones are still being formatted.
+        """
+        stdout_bytes = getattr(sys.stdout, 'buffer', None)
+        if stdout_bytes is None:
+            for line in lines:
+                print(line)
+            return
+        
+        # Flush pending text first so earlier print() output stays in order
+        sys.stdout.flush()
+        lines = iter(lines)
+        while True:
+            batch = list(islice(lines, cls.OUTPUT_BATCH_LINES))
+            if not batch:
+                break
+            batch.append('')
+            stdout_bytes.write('\n'.join(batch).encode('utf-8', errors='replace'))
+        stdout_bytes.flush()
+    
     def _search_stdin(self, options: SearchOptions) -> int:
         """Search content from stdin."""
         try:
-            matches = []
+            matched_lines = 0
             line_number = 0
+            # Match positions only matter for highlighting; otherwise only
+            # whether a line was selected counts
+            presence_only = (options.invert_match or options.count_only or options.quiet
+                             or not options.highlight_matches)
+            pattern = options.patterns[0] if options.patterns else None
             
-            # Read and search stdin line by line
-            for line in sys.stdin:
+            for line_content in self._iter_stdin_lines():
                 line_number += 1
-                line_content = line.rstrip('\n\r')
                 
-                # Find matches in this line
-                line_matches = self.pattern_matcher.find_matches(line_content, line_number, options)
-                should_include = self.pattern_matcher.should_include_line(line_matches, options)
+                if presence_only:
+                    if self.pattern_matcher.has_any_match(line_content, options) == options.invert_match:
+                        continue
+                    # Placeholder match for the selected line
+                    line_matches = [MatchResult(line_number, line_content, 0, 0, pattern)]
+                else:
+                    # Find matches in this line
+                    line_matches = self.pattern_matcher.find_matches(line_content, line_number, options)
+                    if not self.pattern_matcher.should_include_line(line_matches, options):
+                        continue
                 
-                if should_include:
-                    if options.invert_match:
-                        # For invert match, create a dummy match
-                        from ..domain.models import MatchResult
-                        match = MatchResult(
-                            line_number=line_number,
-                            line_content=line_content,
-                            match_start=0,
-                            match_end=0,
-                            pattern=options.patterns[0] if options.patterns else None
-                        )
-                        matches.append(match)
-                    else:
-                        matches.extend(line_matches)
-                    
-                    # Early exit for quiet mode
-                    if options.quiet:
-                        return 0
-                    
-                    # Print immediately for non-quiet, non-count mode
-                    if not options.count_only:
-                        for match in (line_matches if not options.invert_match else [match]):
-                            formatted = self._format_stdin_match(match, options)
-                            if formatted:
-                                print(formatted)
+                matched_lines += 1
+                
+                # Early exit for quiet mode
+                if options.quiet:
+                    return 0
+                
+                # Print immediately for non-quiet, non-count mode
+                if not options.count_only:
+                    print(self._format_stdin_match(line_matches, options))
             
             # Handle count mode
             if options.count_only:
-                print(len(matches))
-                return 0 if matches else 1
+                print(matched_lines)
             
             # Return based on whether we found matches
-            return 0 if matches else 1
+            return 0 if matched_lines else 1
             
         except (EOFError, KeyboardInterrupt):
             return 130
     
-    def _format_stdin_match(self, match, options):
-        """Format a match from stdin."""
+    @staticmethod
+    def _iter_stdin_lines() -> Iterator[str]:
+        """Yield stdin lines without their line terminators.
+        
+        Raw bytes are read in whatever chunks are available and split with
+        one C-level call per chunk, so piped streams are still matched as
+        they arrive but no per-line strip is needed.
+        """
+        stdin_bytes = getattr(sys.stdin, 'buffer', None)
+        if stdin_bytes is None:
+            for line in sys.stdin:
+                yield line.rstrip('\n\r')
+            return
+        
+        read_chunk = getattr(stdin_bytes, 'read1', stdin_bytes.read)
+        pending = b''
+        while True:
+            chunk = read_chunk(65536)
+            if not chunk:
+                break
+            
+            lines = (pending + chunk).split(b'\n')
+            pending = lines.pop()
+            for raw in lines:
+                if raw.endswith(b'\r'):
+                    raw = raw[:-1]
+                yield raw.decode('utf-8', errors='replace')
+        
+        if pending:
+            if pending.endswith(b'\r'):
+                pending = pending[:-1]
+            yield pending.decode('utf-8', errors='replace')
+    
+    def _format_stdin_match(self, matches, options):
+        """Format a selected stdin line from its matches, printed once."""
+        match = matches[0]
         line_content = match.line_content
         
         # Apply highlighting if requested
         if options.highlight_matches:
-            line_content = self.output_formatter.highlight_matches([match], line_content)
+            line_content = self.output_formatter.highlight_matches(matches, line_content)
         
         return f"{match.line_number}:{line_content}"
     
     @staticmethod
     def _validate_file_paths(file_paths: List[str], recursive: bool) -> List[str]:
-        """Validate and filter file paths."""
+        """Validate and filter file paths.
+        
+        Error messages are collected and written to stderr in batches
+        rather than with one print per bad path.
+        """
         valid_paths = []
+        errors = []
         
         for file_path in file_paths:
-            path = Path(file_path)
+            # One stat per argument instead of separate is_file/is_dir probes
+            try:
+                mode = os.stat(file_path).st_mode
+            except OSError:
+                mode = 0
             
-            if path.is_file():
-                valid_paths.append(str(path))
-            elif path.is_dir():
+            if stat.S_ISREG(mode):
+                valid_paths.append(file_path)
+            elif stat.S_ISDIR(mode):
                 if recursive:
-                    valid_paths.append(str(path))
+                    valid_paths.append(file_path)
                 else:
-                    print(f"prep: {file_path}: Is a directory", file=sys.stderr)
+                    errors.append(f"prep: {file_path}: Is a directory\n")
             else:
-                print(f"prep: {file_path}: No such file or directory", file=sys.stderr)
+                errors.append(f"prep: {file_path}: No such file or directory\n")
+            
+            # Keep long argument lists responsive
+            if len(errors) >= 64:
+                sys.stderr.write("".join(errors))
+                errors.clear()
+        
+        if errors:
+            sys.stderr.write("".join(errors))
         
         return valid_paths
     
@@ -190,14 +318,15 @@ class PrepApplication:
             return 2
         
         file_path = file_paths[0]
-        path = Path(file_path)
         
         # Validate file exists and is a regular file
-        if not path.exists():
+        try:
+            mode = os.stat(file_path).st_mode
+        except OSError:
             print(f"prep: {file_path}: No such file or directory", file=sys.stderr)
             return 2
         
-        if not path.is_file():
+        if not stat.S_ISREG(mode):
             print(f"prep: {file_path}: Not a regular file", file=sys.stderr)
             return 2
         
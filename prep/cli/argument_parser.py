@@ -1,12 +1,43 @@
 """Command-line argument parser for prep."""
 
 import argparse
+import dataclasses
+import functools
 import os
 import re
 import sys
-from typing import List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 from ..domain.models import SearchPattern, SearchOptions, MatchType
+from ..infrastructure.boolean_parser import has_boolean_operators
+
+try:
+    import re2 as _re2
+except ImportError:
+    _re2 = None
+
+# Stdlib regex syntax re2 does not support: backreferences, lookarounds,
+# atomic groups, possessive quantifiers and \Z
+_RE2_UNSUPPORTED = re.compile(r'\\[1-9]|\\Z|\(\?P=|\(\?<?[=!]|\(\?>|[*+?}]\+')
+
+# Classes that are Unicode-aware in stdlib re but ASCII-only in re2
+_RE2_ASCII_CLASSES = re.compile(r'\\[bBwWdDsS]')
+
+
+def _is_re2_compatible(search_pattern: SearchPattern) -> bool:
+    """Check whether re2 can run a pattern with the same meaning as the default engine.
+    
+    Patterns the Boolean matcher reads as expressions ('&', '|', '!' or
+    blank) must keep their Boolean meaning under every engine, and re2
+    lacks some stdlib regex syntax. re2 also limits \\b, \\w, \\d and \\s
+    to ASCII, so patterns using them, and -w which wraps the pattern in
+    \\b, would miss or add matches on non-ASCII text.
+    """
+    pattern = search_pattern.pattern
+    return (bool(pattern.strip()) and not has_boolean_operators(pattern)
+            and not _RE2_UNSUPPORTED.search(pattern)
+            and search_pattern.match_type != MatchType.WORD
+            and not _RE2_ASCII_CLASSES.search(pattern))
 
 
 class PrepArgumentParser:
@@ -14,10 +45,16 @@ class PrepArgumentParser:
     
     def __init__(self):
         self.parser = self._create_parser()
+        self._stdout_is_tty = sys.stdout.isatty()
     
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def _create_parser() -> argparse.ArgumentParser:
-        """Create the argument parser with all options."""
+        """Create the argument parser with all options.
+        
+        The parser is built once per process and shared by all instances;
+        parse_args never mutates it.
+        """
         parser = argparse.ArgumentParser(
             prog='prep',
             description='prep - Python grep implementation',
@@ -167,12 +204,11 @@ Examples:
             help='How to handle binary files',
         )
         
-        # Performance options
-        default_threads = os.environ.get('RGREP_THREADS')
+        # Performance options (default resolved per call in parse_args)
         parser.add_argument(
             '-j', '--threads',
             type=int,
-            default=int(default_threads) if default_threads else None,
+            default=None,
             metavar='N',
             help='Use N threads for parallel processing (env: RGREP_THREADS)',
         )
@@ -190,6 +226,15 @@ Examples:
             help='Use extended regular expressions',
         )
         
+        parser.add_argument(
+            '--engine',
+            choices=['re', 're2'],
+            default='re',
+            help='Regex engine to use; re2 guarantees linear-time matching (requires google-re2). '
+                 'Patterns re2 would run differently (Boolean expressions, -w, \\b \\w \\d \\s, '
+                 'backreferences, lookarounds) still use re',
+        )
+        
         # File watching options
         parser.add_argument(
             '-f', '--follow',
@@ -199,9 +244,32 @@ Examples:
         
         return parser
     
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _default_values() -> Dict[str, Any]:
+        """Get the default value of every option, computed once per process."""
+        return vars(PrepArgumentParser._create_parser().parse_args([]))
+    
+    def try_fast_parse(self, args: List[str]) -> Optional[argparse.Namespace]:
+        """Parse the common 'prep -r PATTERN FILE...' shape without argparse.
+        
+        Returns None for any other shape so the full parser handles it,
+        including its error messages.
+        """
+        if len(args) < 2 or args[0] not in ('-r', '--regexp'):
+            return None
+        
+        pattern, files = args[1], args[2:]
+        if pattern.startswith('-') or any(f.startswith('-') and f != '-' for f in files):
+            return None
+        
+        return argparse.Namespace(**{**self._default_values(), 'pattern': pattern, 'files': files})
+    
     def parse_args(self, args: Optional[List[str]] = None) -> Tuple[SearchOptions, List[str]]:
         """Parse command line arguments and return search options and file paths."""
-        parsed = self.parser.parse_args(args)
+        parsed = self.try_fast_parse(sys.argv[1:] if args is None else args)
+        if parsed is None:
+            parsed = self.parser.parse_args(args)
         
         # Validate pattern
         if not parsed.pattern:
@@ -236,14 +304,28 @@ Examples:
             is_regex=not parsed.fixed_strings
         )
         
+        # Compile once up front so matchers never recompile per file or line
+        if not parsed.fixed_strings:
+            if parsed.engine == 're2':
+                search_pattern = self._use_re2(search_pattern)
+            try:
+                search_pattern = dataclasses.replace(search_pattern, compiled=search_pattern.compile())
+            except re.error:
+                # Malformed as a single regex; left uncompiled, HybridPatternMatcher
+                # sends it to the Boolean matcher, which never matches it
+                pass
+        
         # Determine if highlighting should be enabled
         highlight_matches = self._should_highlight(parsed)
         
         # Handle binary files
         ignore_binary = parsed.binary_files == 'without-match'
         
-        # Determine number of threads
-        max_threads = parsed.threads if parsed.threads is not None else 1
+        # Determine number of threads: -j, then RGREP_THREADS, then all cores
+        max_threads = parsed.threads
+        if max_threads is None:
+            env_threads = os.environ.get('RGREP_THREADS')
+            max_threads = int(env_threads) if env_threads else (os.cpu_count() or 1)
         
         # Create search options
         options = SearchOptions(
@@ -269,12 +351,31 @@ Examples:
         
         return options, file_paths
     
-    @staticmethod
-    def _should_highlight(parsed: argparse.Namespace) -> bool:
+    def _use_re2(self, search_pattern: SearchPattern) -> SearchPattern:
+        """Switch the pattern to the re2 engine, unless re2 cannot run it.
+        
+        Patterns re2 cannot run as the default engine would (see
+        _is_re2_compatible) stay on the stdlib engine. The engine is part of
+        the pattern, so worker processes recompile it with re2 as well.
+        """
+        if _re2 is None:
+            self.parser.error("--engine re2 requires the google-re2 package")
+        
+        if not _is_re2_compatible(search_pattern):
+            return search_pattern
+        
+        search_pattern = dataclasses.replace(search_pattern, engine='re2')
+        try:
+            search_pattern.compile()
+        except _re2.error as e:
+            self.parser.error(f"invalid pattern for re2: {e}")
+        return search_pattern
+    
+    def _should_highlight(self, parsed: argparse.Namespace) -> bool:
         """Determine if matches should be highlighted."""
         if parsed.color == 'never':
             return False
         elif parsed.color == 'always':
             return True
         else:  # auto
-            return sys.stdout.isatty()  # Only highlight if outputting to terminal
\ No newline at end of file
+            return self._stdout_is_tty  # Only highlight if outputting to terminal
\ No newline at end of file
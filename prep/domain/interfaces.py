@@ -1,7 +1,7 @@
 """Domain interfaces for prep - the Python grep implementation."""
 
 from abc import ABC, abstractmethod
-from typing import Iterator, List, Optional
+from typing import Any, Callable, Iterator, List, Optional
 
 from .models import FileMatch, SearchOptions, SearchResult, MatchResult
 
@@ -14,6 +14,14 @@ class FileReader(ABC):
         """Read lines from a file."""
         pass
     
+    def read_text_blocks(self, file_path: str) -> Iterator[str]:
+        """Read a file as blocks of decoded text made of whole lines.
+        
+        Splitting each block on '\\n' gives the lines read_lines yields,
+        so a caller can search a whole block at once before splitting it.
+        """
+        yield from self.read_lines(file_path)
+    
     @abstractmethod
     def is_binary(self, file_path: str) -> bool:
         """Check if a file is binary."""
@@ -46,6 +54,18 @@ class PatternMatcher(ABC):
     def should_include_line(self, matches: List[MatchResult], options: SearchOptions) -> bool:
         """Determine if a line should be included based on matches and options."""
         pass
+    
+    def has_any_match(self, content: str, options: SearchOptions) -> bool:
+        """Check whether any pattern matches a line, without collecting matches."""
+        return bool(self.find_matches(content, 0, options))
+    
+    def may_match_block(self, text: str, options: SearchOptions) -> bool:
+        """Check whether any line of a '\\n'-joined block could match.
+        
+        False means no line of the block matches, so the block can be
+        skipped without splitting it. The default cannot tell and says True.
+        """
+        return True
 
 
 class OutputFormatter(ABC):
@@ -56,6 +76,12 @@ class OutputFormatter(ABC):
         """Format the complete search result for output."""
         pass
     
+    def iter_format_result(self, result: SearchResult, options: SearchOptions) -> Iterator[str]:
+        """Yield the output lines of a search result one at a time."""
+        output = self.format_result(result, options)
+        if output:
+            yield from output.split('\n')
+    
     @abstractmethod
     def format_file_match(self, file_match: FileMatch, options: SearchOptions) -> str:
         """Format matches from a single file."""
@@ -89,6 +115,15 @@ class FileWatcher(ABC):
         """Watch a file for new lines and yield them as they are added."""
         pass
     
+    def watch_file_batches(self, file_path: str) -> Iterator[List[str]]:
+        """Watch a file and yield new lines in batches, one per read.
+        
+        A batch ends where the watcher goes back to waiting, so consumers
+        can flush their output once per batch instead of once per line.
+        """
+        for line in self.watch_file(file_path):
+            yield [line]
+    
     @abstractmethod
     def stop_watching(self) -> None:
         """Stop watching the file."""
@@ -101,4 +136,9 @@ class ParallelExecutor(ABC):
     @abstractmethod
     def execute_parallel(self, tasks: List[callable], max_workers: int = None) -> List[any]:
         """Execute tasks in parallel."""
+        pass
+    
+    @abstractmethod
+    def execute_map(self, func: Callable[[Any], Any], items: List[Any], max_workers: int = None) -> List[Any]:
+        """Apply a function to every item in parallel, preserving input order."""
         pass
\ No newline at end of file
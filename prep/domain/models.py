@@ -1,9 +1,17 @@
 """Domain models for prep - the Python grep implementation."""
 
 import re
-from dataclasses import dataclass
+import sys
+from array import array
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import List, Pattern
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Optional, Pattern, Sequence
+
+try:
+    import re2 as _re2
+except ImportError:
+    _re2 = None
 
 
 class MatchType(Enum):
@@ -21,16 +29,58 @@ class RegexFlag(Enum):
     VERBOSE = re.VERBOSE
 
 
-@dataclass(frozen=True)
+# Slotted dataclasses (Python 3.10+) pickle faster and use less memory
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@lru_cache(maxsize=1024)
+def compile_regex(pattern: str, flags: int = 0) -> Pattern[str]:
+    """Compile a regex, reusing previously compiled patterns process-wide."""
+    return re.compile(pattern, flags)
+
+
+@lru_cache(maxsize=1024)
+def compile_re2(pattern: str, flags: int = 0):
+    """Compile a regex with google-re2, translating the stdlib flags prep uses.
+    
+    Raises:
+        ImportError: If google-re2 is not installed
+    """
+    if _re2 is None:
+        raise ImportError("the re2 engine requires the google-re2 package")
+    
+    options = _re2.Options()
+    options.case_sensitive = not flags & re.IGNORECASE
+    options.dot_nl = bool(flags & re.DOTALL)
+    return _re2.compile(pattern, options)
+
+
+@dataclass(frozen=True, **_SLOTS)
 class SearchPattern:
     """Represents a search pattern with its configuration."""
     pattern: str
     match_type: MatchType = MatchType.NORMAL
     regex_flags: int = 0
     is_regex: bool = True
+    engine: str = 're'
+    compiled: Optional[Pattern[str]] = field(default=None, compare=False, repr=False)
     
     def compile(self) -> Pattern[str]:
-        """Compile the pattern into a regex pattern."""
+        """Compile the pattern into a regex pattern.
+        
+        The result is memoized on the instance, so repeated calls from
+        per-line matching cost a single attribute lookup.
+        """
+        if self.compiled is not None:
+            return self.compiled
+        
+        compiled = self._compile()
+        # Frozen dataclass: bypass __setattr__ to memoize
+        object.__setattr__(self, 'compiled', compiled)
+        return compiled
+    
+    def _compile(self) -> Pattern[str]:
+        """Build the regex for this pattern's match type and flags."""
         if self.match_type == MatchType.WORD:
             pattern = rf"\b{re.escape(self.pattern)}\b" if not self.is_regex else rf"\b(?:{self.pattern})\b"
         elif self.match_type == MatchType.LINE:
@@ -38,12 +88,25 @@ class SearchPattern:
         else:
             pattern = re.escape(self.pattern) if not self.is_regex else self.pattern
         
-        return re.compile(pattern, self.regex_flags)
+        if self.engine == 're2':
+            return compile_re2(pattern, self.regex_flags)
+        return compile_regex(pattern, self.regex_flags)
+    
+    def __reduce__(self):
+        """Pickle without the compiled regex; workers recompile it with the same engine."""
+        return (SearchPattern, (self.pattern, self.match_type, self.regex_flags, self.is_regex, self.engine))
 
 
-@dataclass(frozen=True)
+@dataclass
 class MatchResult:
-    """Represents a match found in a line."""
+    """Represents a match found in a line.
+    
+    Not frozen: one is built per match, and a frozen __init__ sets every
+    field through object.__setattr__. The fields have no defaults, so the
+    slots are declared directly and apply on every Python version.
+    """
+    __slots__ = ('line_number', 'line_content', 'match_start', 'match_end', 'pattern')
+    
     line_number: int
     line_content: str
     match_start: int
@@ -51,11 +114,98 @@ class MatchResult:
     pattern: SearchPattern
 
 
-@dataclass(frozen=True)
+class MatchTable(Sequence):
+    """Matches of one file stored column-wise (structure of arrays).
+    
+    Line numbers and offsets live in compact integer arrays and patterns
+    are interned, instead of one MatchResult object per match. Indexing
+    and iteration build MatchResult views on demand, so a table can be
+    used wherever a list of matches is expected.
+    """
+    
+    __slots__ = ('line_numbers', 'starts', 'ends', 'contents', 'pattern_ids', '_patterns', '_pattern_index')
+    
+    def __init__(self, matches: Iterable[MatchResult] = ()):
+        self.line_numbers = array('l')
+        self.starts = array('l')
+        self.ends = array('l')
+        self.contents: List[str] = []
+        self.pattern_ids = array('H')
+        self._patterns: List[Optional[SearchPattern]] = []
+        self._pattern_index: Dict[int, int] = {}
+        self.extend(matches)
+    
+    def add(self, line_number: int, line_content: str, match_start: int, match_end: int,
+            pattern: Optional[SearchPattern]) -> None:
+        """Append one match from its fields, without building a MatchResult."""
+        pattern_id = self._pattern_index.get(id(pattern))
+        if pattern_id is None:
+            pattern_id = self._pattern_index[id(pattern)] = len(self._patterns)
+            self._patterns.append(pattern)
+        
+        self.line_numbers.append(line_number)
+        self.starts.append(match_start)
+        self.ends.append(match_end)
+        self.contents.append(line_content)
+        self.pattern_ids.append(pattern_id)
+    
+    def append(self, match: MatchResult) -> None:
+        """Append a match."""
+        self.add(match.line_number, match.line_content, match.match_start, match.match_end, match.pattern)
+    
+    def extend(self, matches: Iterable[MatchResult]) -> None:
+        """Append several matches."""
+        for match in matches:
+            self.add(match.line_number, match.line_content, match.match_start, match.match_end, match.pattern)
+    
+    def __len__(self) -> int:
+        return len(self.line_numbers)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return MatchResult(
+            self.line_numbers[index],
+            self.contents[index],
+            self.starts[index],
+            self.ends[index],
+            self._patterns[self.pattern_ids[index]]
+        )
+    
+    def __iter__(self) -> Iterator[MatchResult]:
+        patterns = self._patterns
+        for line_number, content, start, end, pattern_id in zip(
+                self.line_numbers, self.contents, self.starts, self.ends, self.pattern_ids):
+            yield MatchResult(line_number, content, start, end, patterns[pattern_id])
+    
+    def __reduce__(self):
+        """Pickle column-wise; files without matches, the usual worker result, pickle to almost nothing."""
+        if not self.contents:
+            return (MatchTable, ())
+        return (MatchTable, (), self.__getstate__())
+    
+    def __getstate__(self):
+        return (self.line_numbers, self.starts, self.ends, self.contents, self.pattern_ids, self._patterns)
+    
+    def __setstate__(self, state) -> None:
+        self.line_numbers, self.starts, self.ends, self.contents, self.pattern_ids, self._patterns = state
+        # Object ids do not survive pickling; re-key the pattern index
+        self._pattern_index = {id(pattern): index for index, pattern in enumerate(self._patterns)}
+    
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, (MatchTable, list, tuple)):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+    
+    def __repr__(self) -> str:
+        return f"MatchTable({list(self)!r})"
+
+
+@dataclass(frozen=True, **_SLOTS)
 class FileMatch:
     """Represents matches found in a file."""
     file_path: str
-    matches: List[MatchResult]
+    matches: Sequence[MatchResult]
     is_binary: bool = False
     
     @property
@@ -64,7 +214,7 @@ class FileMatch:
         return len(self.matches)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class SearchOptions:
     """Configuration options for search operations."""
     patterns: List[SearchPattern]
@@ -85,7 +235,7 @@ class SearchOptions:
         return max(self.context_before, self.context_after)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class SearchResult:
     """Complete result of a search operation."""
     file_matches: List[FileMatch]
@@ -8,9 +8,75 @@ Supports:
 """
 
 import re
-from typing import List, Optional, Union
+from collections import Counter
+from typing import Dict, List, Optional, Pattern, Tuple, Union
 from abc import ABC, abstractmethod
 
+try:
+    from re import _parser as _sre_parse  # Python 3.11+
+except ImportError:
+    import sre_parse as _sre_parse
+
+from ..domain.models import compile_regex
+
+
+# Opcodes of the flattened expression (see CompiledExpression)
+OP_MATCH = 'M'
+OP_NOT = '!'
+OP_JUMP_IF_FALSE_OR_POP = 'JZ'
+OP_JUMP_IF_TRUE_OR_POP = 'JNZ'
+
+# Characters that end a literal: the operators and parentheses
+_LITERAL_END = re.compile(r'[&|!()]')
+
+
+def has_boolean_operators(pattern: str) -> bool:
+    """Check whether a pattern uses any Boolean operator."""
+    # Three C-level substring scans; cheaper than a generator or a regex
+    return '&' in pattern or '|' in pattern or '!' in pattern
+
+
+def extract_required_literal(pattern: str, regex_flags: int = 0) -> Tuple[Optional[str], bool]:
+    """Find the longest plain substring that every match of a regex contains.
+    
+    Only literal characters at the top level of the pattern count, so
+    optional, repeated and alternative parts never contribute. A cheap
+    ``hint in text`` check can then reject most lines before the regex runs.
+    
+    Args:
+        pattern: Regular expression pattern
+        regex_flags: Flags the pattern is compiled with
+        
+    Returns:
+        Tuple of (literal or None, exact), where exact means the regex
+        matches precisely the texts containing the literal
+    """
+    if regex_flags & re.IGNORECASE:
+        return None, False
+    
+    try:
+        parsed = _sre_parse.parse(pattern, regex_flags)
+    except (re.error, RecursionError, OverflowError):
+        return None, False
+    
+    if parsed.state.flags & re.IGNORECASE:
+        return None, False
+    
+    runs = []
+    current = []
+    for op, argument in parsed:
+        if op is _sre_parse.LITERAL:
+            current.append(chr(argument))
+        else:
+            runs.append(''.join(current))
+            current = []
+    runs.append(''.join(current))
+    
+    longest = max(runs, key=len)
+    if not longest:
+        return None, False
+    return longest, len(runs) == 1
+
 
 class BooleanNode(ABC):
     """Abstract base class for boolean expression tree nodes."""
@@ -24,6 +90,21 @@ class BooleanNode(ABC):
     def get_patterns(self) -> List[str]:
         """Get all literal patterns from this node."""
         pass
+    
+    @abstractmethod
+    def requires_match(self) -> bool:
+        """Check whether the expression can only be true if some literal matches."""
+        pass
+    
+    @abstractmethod
+    def compile_to_ops(self, literals: List[str]) -> List[Tuple[str, int]]:
+        """Emit flat evaluation ops for this node (see CompiledExpression).
+        
+        Args:
+            literals: Distinct literal patterns seen so far; new ones are
+                appended and referenced by index
+        """
+        pass
 
 
 class LiteralNode(BooleanNode):
@@ -31,23 +112,64 @@ class LiteralNode(BooleanNode):
     
     def __init__(self, pattern: str):
         self.pattern = pattern
+        self._compiled: Dict[int, Tuple[Optional[Pattern[str]], Optional[str]]] = {}
     
     def evaluate(self, text: str, regex_flags: int = 0) -> bool:
         """Check if the pattern matches the text."""
         try:
-            compiled = re.compile(self.pattern, regex_flags)
-            return compiled.search(text) is not None
-        except re.error:
+            compiled, literal_hint = self._compiled[regex_flags]
+        except KeyError:
+            compiled, literal_hint = self._compile(regex_flags)
+        
+        # Lines without the required literal cannot match; skip the regex
+        if literal_hint is not None and literal_hint not in text:
             return False
+        return compiled is not None and compiled.search(text) is not None
+    
+    def _compile(self, regex_flags: int) -> Tuple[Optional[Pattern[str]], Optional[str]]:
+        """Compile and remember the pattern and its required literal.
+        
+        The compiled pattern is None if it is not a valid regex.
+        """
+        try:
+            compiled = compile_regex(self.pattern, regex_flags)
+            literal_hint, _ = extract_required_literal(self.pattern, regex_flags)
+        except re.error:
+            compiled, literal_hint = None, None
+        
+        self._compiled[regex_flags] = (compiled, literal_hint)
+        return compiled, literal_hint
     
     def get_patterns(self) -> List[str]:
         """Return this pattern."""
         return [self.pattern]
     
+    def requires_match(self) -> bool:
+        """A literal is only true when it matches."""
+        return True
+    
+    def compile_to_ops(self, literals: List[str]) -> List[Tuple[str, int]]:
+        """Push the match result of this literal."""
+        if self.pattern not in literals:
+            literals.append(self.pattern)
+        return [(OP_MATCH, literals.index(self.pattern))]
+    
     def __repr__(self) -> str:
         return f"Literal({self.pattern!r})"
 
 
+def _compile_short_circuit(children: Tuple[BooleanNode, BooleanNode], jump_op: str,
+                           literals: List[str]) -> List[Tuple[str, int]]:
+    """Emit ops for a binary node: first child, conditional jump, second child.
+    
+    Jump targets are relative to the jump op, so the result can be
+    spliced into an enclosing program unchanged.
+    """
+    first = children[0].compile_to_ops(literals)
+    second = children[1].compile_to_ops(literals)
+    return first + [(jump_op, len(second) + 1)] + second
+
+
 class NotNode(BooleanNode):
     """Node representing NOT operation."""
     
@@ -62,6 +184,14 @@ class NotNode(BooleanNode):
         """Get patterns from child."""
         return self.child.get_patterns()
     
+    def requires_match(self) -> bool:
+        """A negation is true when nothing matches."""
+        return False
+    
+    def compile_to_ops(self, literals: List[str]) -> List[Tuple[str, int]]:
+        """Negate the child's result."""
+        return self.child.compile_to_ops(literals) + [(OP_NOT, 0)]
+    
     def __repr__(self) -> str:
         return f"Not({self.child!r})"
 
@@ -72,15 +202,26 @@ class AndNode(BooleanNode):
     def __init__(self, left: BooleanNode, right: BooleanNode):
         self.left = left
         self.right = right
+        # Evaluation order; the parser may swap it so short-circuiting kicks in sooner
+        self.ordered = (left, right)
     
     def evaluate(self, text: str, regex_flags: int = 0) -> bool:
         """Both children must evaluate to True."""
-        return self.left.evaluate(text, regex_flags) and self.right.evaluate(text, regex_flags)
+        first, second = self.ordered
+        return first.evaluate(text, regex_flags) and second.evaluate(text, regex_flags)
     
     def get_patterns(self) -> List[str]:
         """Get patterns from both children."""
         return self.left.get_patterns() + self.right.get_patterns()
     
+    def requires_match(self) -> bool:
+        """Either side requiring a match is enough."""
+        return self.left.requires_match() or self.right.requires_match()
+    
+    def compile_to_ops(self, literals: List[str]) -> List[Tuple[str, int]]:
+        """Skip the second child when the first is False."""
+        return _compile_short_circuit(self.ordered, OP_JUMP_IF_FALSE_OR_POP, literals)
+    
     def __repr__(self) -> str:
         return f"And({self.left!r}, {self.right!r})"
 
@@ -91,15 +232,26 @@ class OrNode(BooleanNode):
     def __init__(self, left: BooleanNode, right: BooleanNode):
         self.left = left
         self.right = right
+        # Evaluation order; the parser may swap it so short-circuiting kicks in sooner
+        self.ordered = (left, right)
     
     def evaluate(self, text: str, regex_flags: int = 0) -> bool:
         """At least one child must evaluate to True."""
-        return self.left.evaluate(text, regex_flags) or self.right.evaluate(text, regex_flags)
+        first, second = self.ordered
+        return first.evaluate(text, regex_flags) or second.evaluate(text, regex_flags)
     
     def get_patterns(self) -> List[str]:
         """Get patterns from both children."""
         return self.left.get_patterns() + self.right.get_patterns()
     
+    def requires_match(self) -> bool:
+        """Both sides must require a match."""
+        return self.left.requires_match() and self.right.requires_match()
+    
+    def compile_to_ops(self, literals: List[str]) -> List[Tuple[str, int]]:
+        """Skip the second child when the first is True."""
+        return _compile_short_circuit(self.ordered, OP_JUMP_IF_TRUE_OR_POP, literals)
+    
     def __repr__(self) -> str:
         return f"Or({self.left!r}, {self.right!r})"
 
@@ -120,6 +272,8 @@ class BooleanExpressionParser:
         self.pattern = pattern
         self.pos = 0
         self.length = len(pattern)
+        # Repeated literals share one node (and its compiled regex)
+        self._literals: Dict[str, LiteralNode] = {}
     
     def parse(self) -> Optional[BooleanNode]:
         """Parse the pattern into a boolean expression tree."""
@@ -127,7 +281,7 @@ class BooleanExpressionParser:
             return None
         
         # Check if pattern contains boolean operators
-        if not any(op in self.pattern for op in ['&', '|', '!']):
+        if not has_boolean_operators(self.pattern):
             # Simple pattern without boolean operators
             return LiteralNode(self.pattern)
         
@@ -136,6 +290,7 @@ class BooleanExpressionParser:
             if self.pos < self.length:
                 # There's unparsed content - treat as simple pattern
                 return LiteralNode(self.pattern)
+            self._order_by_selectivity(result)
             return result
         except Exception:
             # If parsing fails, treat as literal pattern
@@ -190,12 +345,9 @@ class BooleanExpressionParser:
         self._skip_whitespace()
         start = self.pos
         
-        # Collect characters until we hit an operator or closing paren
-        while self.pos < self.length:
-            ch = self.pattern[self.pos]
-            if ch in ['&', '|', '!', '(', ')']:
-                break
-            self.pos += 1
+        # The literal runs up to the next operator or parenthesis
+        end = _LITERAL_END.search(self.pattern, start)
+        self.pos = end.start() if end else self.length
         
         if self.pos == start:
             raise ValueError(f"Expected literal at position {self.pos}")
@@ -204,7 +356,49 @@ class BooleanExpressionParser:
         if not literal:
             raise ValueError(f"Empty literal at position {start}")
         
-        return LiteralNode(literal)
+        try:
+            return self._literals[literal]
+        except KeyError:
+            node = self._literals[literal] = LiteralNode(literal)
+            return node
+    
+    @classmethod
+    def _order_by_selectivity(cls, node: BooleanNode) -> float:
+        """Order AND/OR children for early short-circuiting.
+        
+        Returns a rough estimate of how likely the node is to be true. AND
+        nodes evaluate their least likely child first, OR nodes their most
+        likely child first, so fewer regex searches run per line. Only the
+        evaluation order changes; left/right and get_patterns() keep the
+        order the expression was written in.
+        """
+        if isinstance(node, LiteralNode):
+            return cls._literal_match_probability(node.pattern)
+        
+        if isinstance(node, NotNode):
+            return 1.0 - cls._order_by_selectivity(node.child)
+        
+        if isinstance(node, (AndNode, OrNode)):
+            left = cls._order_by_selectivity(node.left)
+            right = cls._order_by_selectivity(node.right)
+            if isinstance(node, AndNode):
+                node.ordered = (node.left, node.right) if left <= right else (node.right, node.left)
+                return left * right
+            node.ordered = (node.left, node.right) if left >= right else (node.right, node.left)
+            return 1.0 - (1.0 - left) * (1.0 - right)
+        
+        return 0.5
+    
+    @staticmethod
+    def _literal_match_probability(pattern: str) -> float:
+        """Estimate how likely a literal is to match a line.
+        
+        Longer runs of plain characters are rarer; wildcards and optional
+        quantifiers make a pattern more permissive.
+        """
+        plain_chars = sum(1 for ch in pattern if ch.isalnum() or ch in ' _-')
+        wildcards = pattern.count('.*') + pattern.count('?') + pattern.count('.+')
+        return min(1.0, (1.0 + wildcards) / (1.0 + plain_chars))
     
     def _peek(self) -> str:
         """Peek at current character without consuming."""
@@ -226,6 +420,132 @@ class BooleanExpressionParser:
             self.pos += 1
 
 
+class CompiledExpression:
+    """A Boolean expression tree flattened into a list of ops.
+    
+    AND/OR become conditional jumps, so short-circuiting works as in the
+    tree. The ops are turned once into a single Python expression over the
+    literals' bound search methods, which evaluates each line without a
+    method call per node. A literal used more than once is searched at
+    most once per line; its result is kept in a per-call default argument.
+    Expressions nested too deeply for the compiler are run by a small stack
+    interpreter over the ops instead.
+    """
+    
+    def __init__(self, tree: BooleanNode, regex_flags: int = 0):
+        self._tree = tree
+        self._regex_flags = regex_flags
+        literals: List[str] = []
+        self.ops = tree.compile_to_ops(literals)
+        self.literals = literals
+        self._searches = [self._compile_search(literal, regex_flags) for literal in literals]
+        self._hints = [extract_required_literal(literal, regex_flags) for literal in literals]
+        
+        uses = Counter(arg for op, arg in self.ops if op == OP_MATCH)
+        self._shared = {index for index, count in uses.items() if count > 1}
+        
+        namespace = {f"s{index}": search for index, search in enumerate(self._searches)}
+        namespace.update((f"h{index}", hint) for index, (hint, _) in enumerate(self._hints))
+        params = "".join(f", m{index}=None" for index in sorted(self._shared))
+        try:
+            source = self._translate(self.ops, 0, len(self.ops))
+            self.evaluate = eval(f"lambda text{params}: {source}", namespace)
+        except (SyntaxError, RecursionError, MemoryError):
+            self.evaluate = self._run_ops
+    
+    def __reduce__(self):
+        """Pickle as the source tree; the generated function is rebuilt on load."""
+        return (CompiledExpression, (self._tree, self._regex_flags))
+    
+    @staticmethod
+    def _compile_search(pattern: str, regex_flags: int):
+        """Get the search function for a literal; invalid regexes never match."""
+        try:
+            return compile_regex(pattern, regex_flags).search
+        except re.error:
+            return lambda text: None
+    
+    def _literal_source(self, index: int) -> str:
+        """Source of the match test for one literal, prefiltered by its hint."""
+        hint, exact = self._hints[index]
+        if hint is None:
+            test = f"(s{index}(text) is not None)"
+        elif exact:
+            # The regex is just this string; containment is the answer
+            test = f"(h{index} in text)"
+        else:
+            test = f"(h{index} in text and s{index}(text) is not None)"
+        
+        if index in self._shared:
+            # Whichever use runs first stores the result for the others
+            return f"(m{index} if m{index} is not None else (m{index} := {test}))"
+        return test
+    
+    def _translate(self, ops: List[Tuple[str, int]], start: int, end: int) -> str:
+        """Translate ops[start:end] back into a Python Boolean expression."""
+        stack: List[str] = []
+        pc = start
+        while pc < end:
+            op, arg = ops[pc]
+            if op == OP_MATCH:
+                stack.append(self._literal_source(arg))
+            elif op == OP_NOT:
+                stack[-1] = f"(not {stack[-1]})"
+            else:
+                # The jump skips exactly the ops of the second operand
+                second = self._translate(ops, pc + 1, pc + arg)
+                joiner = "and" if op == OP_JUMP_IF_FALSE_OR_POP else "or"
+                stack[-1] = f"({stack[-1]} {joiner} {second})"
+                pc += arg
+                continue
+            pc += 1
+        
+        return stack[-1]
+    
+    def evaluate(self, text: str) -> bool:
+        """Evaluate the expression against a line of text."""
+        return self._run_ops(text)
+    
+    def _run_ops(self, text: str) -> bool:
+        """Interpret the ops with a stack; each literal is searched at most once."""
+        searches = self._searches
+        hints = self._hints
+        results: Dict[int, bool] = {}
+        stack: List[bool] = []
+        ops = self.ops
+        pc = 0
+        end = len(ops)
+        while pc < end:
+            op, arg = ops[pc]
+            if op == OP_MATCH:
+                result = results.get(arg)
+                if result is None:
+                    hint, exact = hints[arg]
+                    if hint is not None and hint not in text:
+                        result = False
+                    elif exact:
+                        result = True
+                    else:
+                        result = searches[arg](text) is not None
+                    results[arg] = result
+                stack.append(result)
+            elif op == OP_NOT:
+                stack[-1] = not stack[-1]
+            elif op == OP_JUMP_IF_FALSE_OR_POP:
+                if not stack[-1]:
+                    pc += arg
+                    continue
+                stack.pop()
+            elif op == OP_JUMP_IF_TRUE_OR_POP:
+                if stack[-1]:
+                    pc += arg
+                    continue
+                stack.pop()
+            pc += 1
+        
+        return stack[-1]
+
+
 def parse_boolean_pattern(pattern: str) -> Optional[BooleanNode]:
     """Parse a pattern string into a boolean expression tree.
     
@@ -1,11 +1,23 @@
 """Chronological merging for timestamped log entries."""
 
+import heapq
 import re
 from datetime import datetime
-from typing import List, Optional, Tuple
+from itertools import groupby, repeat
+from operator import itemgetter, le
+from typing import List, Optional, Sequence, Tuple
 from ..domain.models import MatchResult, FileMatch, SearchResult
 
 
+# Sort key of merge entries: (timestamp, file index, line number)
+_entry_key = itemgetter(0, 1, 2)
+_entry_file = itemgetter(1)
+
+# Maps a leading 'YYYY-MM-DD[T ]HH:MM:SS' onto a single fixed shape
+_STAMP_SHAPE = str.maketrans('123456789T', '000000000 ')
+_LEADING_STAMP = '0000-00-00 00:00:00'
+
+
 class TimestampParser:
     """Parser for ISO-8601 timestamps in log lines."""
     
@@ -24,6 +36,15 @@ class TimestampParser:
         Returns:
             datetime object if timestamp found and valid, None otherwise
         """
+        # Fast path: most log lines start with the timestamp, which the C
+        # ISO parser handles far faster than regex + strptime
+        if (len(text) >= 19 and text[4] == '-' and text[7] == '-'
+                and text[10] in 'T ' and text[13] == ':' and text[16] == ':'):
+            try:
+                return datetime.fromisoformat(text[:19])
+            except ValueError:
+                pass
+        
         match = cls.TIMESTAMP_PATTERN.search(text)
         if not match:
             return None
@@ -36,6 +57,30 @@ class TimestampParser:
             return datetime.strptime(timestamp_str, '%Y-%m-%d %H:%M:%S')
         except ValueError:
             return None
+    
+    @classmethod
+    def parse_leading_timestamps(cls, texts: Sequence[str]) -> Optional[List[datetime]]:
+        """Parse the timestamps of lines that all start with one, in bulk.
+        
+        The shape of every prefix is checked with one translate over the
+        joined prefixes, and they are parsed by mapping the C ISO parser
+        over them, so there is no per-line Python code.
+        
+        Args:
+            texts: Lines to parse
+            
+        Returns:
+            One datetime per line, or None if any line does not start with a
+            valid timestamp (parse_timestamp handles those)
+        """
+        stamps = [text[:19] for text in texts]
+        if ''.join(stamps).translate(_STAMP_SHAPE) != _LEADING_STAMP * len(stamps):
+            return None
+        
+        try:
+            return list(map(datetime.fromisoformat, stamps))
+        except ValueError:
+            return None
 
 
 class ChronologicalMerger:
@@ -55,61 +100,46 @@ class ChronologicalMerger:
         if len(result.file_matches) <= 1:
             return result
         
-        # Extract all matches with their file information
-        all_matches_with_meta = []
+        # Timestamp every match as (timestamp, file_idx, line_number, match)
+        # tuples, one list per file
+        per_file_entries = []
         
         for file_idx, file_match in enumerate(result.file_matches):
-            for match in file_match.matches:
-                # Try to parse timestamp from the match
-                timestamp = TimestampParser.parse_timestamp(match.line_content)
-                
-                if timestamp is None:
+            matches = list(file_match.matches)
+            contents = [match.line_content for match in matches]
+            
+            # Most log lines start with their timestamp; parse those in bulk
+            timestamps = TimestampParser.parse_leading_timestamps(contents)
+            if timestamps is None:
+                timestamps = list(map(TimestampParser.parse_timestamp, contents))
+                if None in timestamps:
                     # If ANY match lacks a timestamp, abort chronological merge
                     return result
-                
-                all_matches_with_meta.append({
-                    'timestamp': timestamp,
-                    'file_idx': file_idx,
-                    'file_path': file_match.file_path,
-                    'match': match
-                })
-        
-        # All matches have timestamps - sort chronologically
-        all_matches_with_meta.sort(
-            key=lambda x: (x['timestamp'], x['file_idx'], x['match'].line_number)
-        )
-        
-        # Rebuild file matches in chronological order
-        # Group by file to maintain FileMatch structure
-        merged_file_matches = []
-        current_file = None
-        current_matches = []
+            
+            line_numbers = [match.line_number for match in matches]
+            entries = list(zip(timestamps, repeat(file_idx), line_numbers, matches))
+            
+            # Log files are almost always already in time order; only
+            # sort the rare file that is not
+            keys = list(zip(timestamps, line_numbers))
+            if not all(map(le, keys, keys[1:])):
+                entries.sort(key=_entry_key)
+            per_file_entries.append(entries)
         
-        for item in all_matches_with_meta:
-            if current_file != item['file_path']:
-                if current_file is not None:
-                    # Save previous file's matches
-                    merged_file_matches.append(
-                        FileMatch(
-                            file_path=current_file,
-                            matches=current_matches,
-                            is_binary=False
-                        )
-                    )
-                current_file = item['file_path']
-                current_matches = [item['match']]
-            else:
-                current_matches.append(item['match'])
+        # All matches have timestamps - k-way merge of the sorted files
+        merged = heapq.merge(*per_file_entries, key=_entry_key)
         
-        # Don't forget the last file
-        if current_file is not None:
-            merged_file_matches.append(
-                FileMatch(
-                    file_path=current_file,
-                    matches=current_matches,
-                    is_binary=False
-                )
+        # Rebuild file matches in chronological order, one FileMatch per run
+        # of consecutive entries from the same file (grouped by file index)
+        file_paths = [file_match.file_path for file_match in result.file_matches]
+        merged_file_matches = [
+            FileMatch(
+                file_path=file_paths[file_idx],
+                matches=[entry[3] for entry in run],
+                is_binary=False
             )
+            for file_idx, run in groupby(merged, key=_entry_file)
+        ]
         
         return SearchResult(
             file_matches=merged_file_matches,
@@ -2,70 +2,111 @@
 
 import os
 import time
-from typing import Iterator
-from pathlib import Path
+from collections import deque
+from typing import Iterator, List
 
 from ..domain.interfaces import FileWatcher
 
 
 class StandardFileWatcher(FileWatcher):
-    """Standard implementation of file watching using polling."""
+    """Standard implementation of file watching using polling.
     
-    def __init__(self, poll_interval: float = 0.1):
+    The poll interval backs off while the file is idle and snaps back to
+    the fastest rate as soon as it grows. By default it backs off no
+    further than 0.1s, the fixed interval polling used before, so new
+    lines in an idle file show up no later than they used to. The file is
+    kept open between polls as a raw descriptor and only re-opened when it
+    is replaced (e.g. by log rotation). An idle poll costs a single stat
+    call.
+    """
+    
+    READ_SIZE = 65536
+    BACKOFF_FACTOR = 1.5
+    
+    def __init__(self, poll_interval: float = 0.01, max_poll_interval: float = 0.1):
         """
         Initialize the file watcher.
         
         Args:
-            poll_interval: Time in seconds between file checks
+            poll_interval: Time in seconds between file checks while active
+            max_poll_interval: Longest time in seconds between checks of an
+                idle file
         """
         self.poll_interval = poll_interval
+        self.max_poll_interval = max(max_poll_interval, poll_interval)
         self._watching = True
         self._last_position = 0
     
     def watch_file(self, file_path: str) -> Iterator[str]:
         """Watch a file for new lines and yield them as they are added."""
-        path = Path(file_path)
-        
-        if not path.exists():
+        for lines in self.watch_file_batches(file_path):
+            yield from lines
+    
+    def watch_file_batches(self, file_path: str) -> Iterator[List[str]]:
+        """Watch a file and yield the complete new lines of each read as a list."""
+        if not os.path.exists(file_path):
             raise FileNotFoundError(f"File not found: {file_path}")
         
         # Initialize position to end of file for tail behavior
-        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-            f.seek(0, 2)  # Seek to end of file
-            self._last_position = f.tell()
-        
-        self._watching = True
-        
-        while self._watching:
-            try:
-                current_size = os.path.getsize(file_path)
+        fd = os.open(file_path, os.O_RDONLY)
+        try:
+            self._last_position = os.lseek(fd, 0, os.SEEK_END)
+            inode = os.fstat(fd).st_ino
+            pending = b''
+            interval = self.poll_interval
+            
+            self._watching = True
+            
+            while self._watching:
+                try:
+                    path_stat = os.stat(file_path)
+                except FileNotFoundError:
+                    # File was deleted
+                    break
+                except OSError:
+                    # For other errors, continue trying
+                    time.sleep(interval)
+                    continue
+                
+                if path_stat.st_ino != inode:
+                    # File was recreated, follow the new one from its start
+                    os.close(fd)
+                    fd = os.open(file_path, os.O_RDONLY)
+                    inode = os.fstat(fd).st_ino
+                    self._last_position = 0
+                    pending = b''
+                elif path_stat.st_size < self._last_position:
+                    # File was truncated, reset position
+                    self._last_position = os.lseek(fd, 0, os.SEEK_SET)
+                    pending = b''
                 
-                if current_size > self._last_position:
+                if path_stat.st_size > self._last_position:
                     # File has grown, read new content
-                    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                        f.seek(self._last_position)
-                        new_content = f.read()
-                        self._last_position = f.tell()
+                    interval = self.poll_interval
+                    while True:
+                        chunk = os.read(fd, self.READ_SIZE)
+                        if not chunk:
+                            break
+                        self._last_position += len(chunk)
                         
-                        # Yield each new line
-                        for line in new_content.splitlines():
+                        # Only complete lines are yielded; keep the partial tail
+                        raw_lines = (pending + chunk).split(b'\n')
+                        pending = raw_lines.pop()
+                        lines = []
+                        for raw_line in raw_lines:
+                            line = raw_line.decode('utf-8', errors='ignore').rstrip('\r')
                             if line:  # Skip empty lines
-                                yield line
+                                lines.append(line)
+                        if lines:
+                            yield lines
+                else:
+                    interval = min(interval * self.BACKOFF_FACTOR, self.max_poll_interval)
                 
-                elif current_size < self._last_position:
-                    # File was truncated or recreated, reset position
-                    self._last_position = 0
-                
-                time.sleep(self.poll_interval)
-                
-            except (OSError, IOError):
-                # File might have been deleted or become inaccessible
-                if not Path(file_path).exists():
-                    break
-                # For other errors, continue trying
-                time.sleep(self.poll_interval)
-            except KeyboardInterrupt:
-                break
+                time.sleep(interval)
+        except KeyboardInterrupt:
+            return
+        finally:
+            os.close(fd)
     
     def stop_watching(self) -> None:
         """Stop watching the file."""
@@ -85,7 +126,8 @@ class ContextBuffer:
         """
         self.before_lines = before_lines
         self.after_lines = after_lines
-        self._buffer = []
+        # Bounded deque: appending evicts the oldest line in O(1)
+        self._buffer = deque(maxlen=before_lines)
         self._line_number = 0
         self._after_match_count = 0
         
@@ -99,8 +141,6 @@ class ContextBuffer:
         # Maintain before context buffer
         if self.before_lines > 0:
             self._buffer.append(line_info)
-            if len(self._buffer) > self.before_lines:
-                self._buffer.pop(0)
     
     def get_context_for_match(self, match_line_number: int, match_line: str) -> dict:
         """
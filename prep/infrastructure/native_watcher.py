@@ -0,0 +1,228 @@
+"""Event-driven file watching using native kernel notification APIs."""
+
+import ctypes
+import os
+import select
+import struct
+import sys
+from errno import ENOENT
+from functools import lru_cache
+from typing import Iterator, List, Optional, Tuple
+
+from ..domain.interfaces import FileWatcher
+
+
+# inotify event masks (see <sys/inotify.h>)
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_IGNORED = 0x00008000
+
+# struct inotify_event header: wd, mask, cookie, len (name follows)
+_EVENT_HEADER = struct.Struct('iIII')
+
+
+@lru_cache(maxsize=None)
+def _load_libc() -> Optional[ctypes.CDLL]:
+    """Load libc with inotify bindings, or None if inotify is unavailable."""
+    if not sys.platform.startswith('linux'):
+        return None
+
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+    except OSError:
+        return None
+
+    if not all(hasattr(libc, name) for name in ('inotify_init1', 'inotify_add_watch', 'inotify_rm_watch')):
+        return None
+
+    libc.inotify_init1.argtypes = [ctypes.c_int]
+    libc.inotify_init1.restype = ctypes.c_int
+    libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+    libc.inotify_add_watch.restype = ctypes.c_int
+    libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+    libc.inotify_rm_watch.restype = ctypes.c_int
+    return libc
+
+
+class LinuxInotifyWatcher(FileWatcher):
+    """File watcher that blocks on inotify events instead of polling.
+
+    Only the bytes appended since the last event are read, through a file
+    descriptor kept open until the file is moved or deleted. Then, as after
+    log rotation, the watch moves to the parent directory until a file
+    appears at the path again, and that file is followed from its start.
+    """
+
+    WATCH_MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_ATTRIB | IN_DELETE_SELF | IN_MOVE_SELF
+    DIRECTORY_MASK = IN_CREATE | IN_MOVED_TO
+    READ_SIZE = 65536
+
+    def __init__(self, wakeup_interval: float = 0.5):
+        """
+        Initialize the file watcher.
+
+        Args:
+            wakeup_interval: Longest time in seconds to block before
+                re-checking whether watching was stopped
+        """
+        self.wakeup_interval = wakeup_interval
+        self._watching = True
+
+    @staticmethod
+    def is_supported() -> bool:
+        """Check whether inotify is available on this platform."""
+        return _load_libc() is not None
+
+    def watch_file(self, file_path: str) -> Iterator[str]:
+        """Watch a file for new lines and yield them as they are added."""
+        for lines in self.watch_file_batches(file_path):
+            yield from lines
+
+    def watch_file_batches(self, file_path: str) -> Iterator[List[str]]:
+        """Watch a file and yield the complete new lines of each read as a list."""
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"File not found: {file_path}")
+
+        libc = _load_libc()
+        if libc is None:
+            raise OSError("inotify is not available on this platform")
+
+        inotify_fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if inotify_fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+
+        file_fd = None
+        directory_wd = None
+        try:
+            # Start at the end of the file for tail behavior
+            file_fd, file_wd = self._open_watched(libc, inotify_fd, file_path)
+            if file_fd is None:
+                raise FileNotFoundError(f"File not found: {file_path}")
+            offset = os.lseek(file_fd, 0, os.SEEK_END)
+            pending = b''
+
+            self._watching = True
+            while self._watching:
+                if file_fd is None:
+                    # The file was moved or deleted; follow whatever appears at its path
+                    file_fd, file_wd = self._open_watched(libc, inotify_fd, file_path)
+                    if file_fd is None:
+                        select.select([inotify_fd], [], [], self.wakeup_interval)
+                        self._drain_events(inotify_fd, file_wd)
+                        continue
+                    libc.inotify_rm_watch(inotify_fd, directory_wd)
+                    directory_wd = None
+                    offset = 0
+                    pending = b''
+                    event_mask = 0
+                else:
+                    ready, _, _ = select.select([inotify_fd], [], [], self.wakeup_interval)
+                    if not ready:
+                        continue
+                    event_mask = self._drain_events(inotify_fd, file_wd)
+
+                file_stat = os.fstat(file_fd)
+
+                if file_stat.st_size < offset:
+                    # File was truncated, start over from the beginning
+                    offset = os.lseek(file_fd, 0, os.SEEK_SET)
+                    pending = b''
+
+                while True:
+                    chunk = os.read(file_fd, self.READ_SIZE)
+                    if not chunk:
+                        break
+                    offset += len(chunk)
+
+                    # Only complete lines are yielded; keep the partial tail
+                    raw_lines = (pending + chunk).split(b'\n')
+                    pending = raw_lines.pop()
+                    lines = []
+                    for raw_line in raw_lines:
+                        line = raw_line.decode('utf-8', errors='ignore').rstrip('\r')
+                        if line:  # Skip empty lines
+                            lines.append(line)
+                    if lines:
+                        yield lines
+
+                # The open descriptor keeps a deleted file alive, so
+                # IN_DELETE_SELF never arrives; the link count drops instead
+                if file_stat.st_nlink == 0 or event_mask & (IN_DELETE_SELF | IN_MOVE_SELF | IN_IGNORED):
+                    # File was deleted or moved away (e.g. rotated); its
+                    # remaining lines were read above. Watch the directory
+                    # first so a file created from now on is not missed
+                    directory = os.path.dirname(os.path.abspath(file_path))
+                    directory_wd = self._add_watch(libc, inotify_fd, directory, self.DIRECTORY_MASK)
+                    libc.inotify_rm_watch(inotify_fd, file_wd)
+                    os.close(file_fd)
+                    file_fd = None
+        except KeyboardInterrupt:
+            return
+        finally:
+            if file_fd is not None:
+                os.close(file_fd)
+            os.close(inotify_fd)
+
+    @classmethod
+    def _open_watched(cls, libc: ctypes.CDLL, inotify_fd: int, file_path: str) -> Tuple[Optional[int], int]:
+        """Watch and open a file; returns (None, -1) if it does not exist.
+
+        The watch is added before opening, so no write in between goes
+        unnoticed.
+        """
+        try:
+            file_wd = cls._add_watch(libc, inotify_fd, file_path, cls.WATCH_MASK)
+        except FileNotFoundError:
+            return None, -1
+
+        try:
+            return os.open(file_path, os.O_RDONLY), file_wd
+        except FileNotFoundError:
+            libc.inotify_rm_watch(inotify_fd, file_wd)
+            return None, -1
+
+    @staticmethod
+    def _add_watch(libc: ctypes.CDLL, inotify_fd: int, path: str, mask: int) -> int:
+        """Add an inotify watch and return its descriptor."""
+        wd = libc.inotify_add_watch(inotify_fd, os.fsencode(path), mask)
+        if wd < 0:
+            errno = ctypes.get_errno()
+            if errno == ENOENT:
+                raise FileNotFoundError(errno, os.strerror(errno), path)
+            raise OSError(errno, os.strerror(errno), path)
+        return wd
+
+    def stop_watching(self) -> None:
+        """Stop watching the file."""
+        self._watching = False
+
+    @staticmethod
+    def _drain_events(inotify_fd: int, file_wd: int) -> int:
+        """Read all queued inotify events and return the combined mask of the file's watch.
+
+        Events of other watches (the directory, or a file watched before a
+        rotation) only wake the watcher up.
+        """
+        event_mask = 0
+        while True:
+            try:
+                data = os.read(inotify_fd, 4096)
+            except BlockingIOError:
+                break
+            if not data:
+                break
+
+            pos = 0
+            while pos + _EVENT_HEADER.size <= len(data):
+                wd, mask, _, name_length = _EVENT_HEADER.unpack_from(data, pos)
+                if wd == file_wd:
+                    event_mask |= mask
+                pos += _EVENT_HEADER.size + name_length
+
+        return event_mask
@@ -1,10 +1,12 @@
 """Infrastructure implementation for output formatting."""
 
-from typing import List, Optional, Dict
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
 from collections import defaultdict
+from itertools import groupby
+from operator import attrgetter, le
 
 from ..domain.interfaces import OutputFormatter
-from ..domain.models import SearchResult, FileMatch, MatchResult, SearchOptions
+from ..domain.models import SearchResult, FileMatch, MatchResult, MatchTable, SearchOptions
 
 
 class ANSIColors:
@@ -21,28 +23,46 @@ class ANSIColors:
     RESET = '\033[0m'
 
 
+# Wrappers around each highlighted span
+HIGHLIGHT_START = ANSIColors.RED + ANSIColors.BOLD
+HIGHLIGHT_END = ANSIColors.RESET
+
+_line_number = attrgetter('line_number')
+
+
+def _line_items(matches: Sequence[MatchResult]) -> Iterable[Tuple[int, str]]:
+    """Iterate (line_number, line_content) pairs of matches.
+    
+    A MatchTable already stores both as columns, so they are zipped
+    directly instead of building a MatchResult view per match.
+    """
+    if isinstance(matches, MatchTable):
+        return zip(matches.line_numbers, matches.contents)
+    return ((match.line_number, match.line_content) for match in matches)
+
+
 class StandardOutputFormatter(OutputFormatter):
     """Standard output formatter implementation."""
     
     def format_result(self, result: SearchResult, options: SearchOptions) -> str:
         """Format the complete search result for output."""
+        return '\n'.join(self.iter_format_result(result, options))
+    
+    def iter_format_result(self, result: SearchResult, options: SearchOptions) -> Iterator[str]:
+        """Yield the output lines of a search result one at a time."""
         if options.quiet:
-            return ""
+            return
         
         if options.count_only:
-            return self._format_count_result(result)
+            yield from self.format_count_result_stream(result)
+            return
         
         # Show filename prefix for multiple files
         show_filename = len(result.file_matches) > 1
         
-        output_lines = []
         for file_match in result.file_matches:
             if file_match.matches:
-                formatted = self.format_file_match(file_match, options, show_filename)
-                if formatted:
-                    output_lines.append(formatted)
-        
-        return '\n'.join(output_lines)
+                yield from self._iter_file_lines(file_match, options, show_filename)
     
     def format_file_match(self, file_match: FileMatch, options: SearchOptions, show_filename: bool = False) -> str:
         """Format matches from a single file."""
@@ -52,27 +72,25 @@ class StandardOutputFormatter(OutputFormatter):
         if options.count_only:
             return f"{file_match.file_path}:{file_match.match_count}"
         
-        output_lines = []
-        
+        return '\n'.join(self._iter_file_lines(file_match, options, show_filename))
+    
+    def _iter_file_lines(self, file_match: FileMatch, options: SearchOptions, show_filename: bool) -> Iterator[str]:
+        """Yield the output lines for the matches of a single file."""
         # Group matches by line number for context handling
-        matches_by_line = defaultdict(list)
-        for match in file_match.matches:
-            matches_by_line[match.line_number].append(match)
+        line_groups = self._group_by_line(file_match.matches)
+        
+        # The filename part of the prefix is the same for every line
+        file_prefix = f"{file_match.file_path}:" if show_filename else ""
         
         # Handle context lines
         if options.context_before > 0 or options.context_after > 0:
-            output_lines.extend(self._format_with_context(file_match, options, matches_by_line, show_filename))
+            yield from self._format_with_context(file_match, options, line_groups, show_filename)
         else:
             # Simple format without context
-            for line_number in sorted(matches_by_line.keys()):
-                matches = matches_by_line[line_number]
-                formatted_line = self._format_match_line_group(
-                    matches, file_match.file_path, options, show_filename
-                )
+            for _, matches in line_groups:
+                formatted_line = self._format_match_line_group(matches, file_prefix, options)
                 if formatted_line:
-                    output_lines.append(formatted_line)
-        
-        return '\n'.join(output_lines)
+                    yield formatted_line
     
     def format_match_line(self, match: MatchResult, options: SearchOptions, context_lines: Optional[List[str]] = None) -> str:
         """Format a single matching line."""
@@ -90,21 +108,45 @@ class StandardOutputFormatter(OutputFormatter):
         return f"{file_prefix}{line_prefix}{line_content}"
     
     @staticmethod
-    def _format_count_result(result: SearchResult) -> str:
-        """Format count-only result."""
+    def _group_by_line(matches: Sequence[MatchResult]) -> List[Tuple[int, List[MatchResult]]]:
+        """Group matches by line number, in ascending line order.
+        
+        Matches usually arrive in line order from a sequential scan, so
+        consecutive runs are grouped directly; only unordered input pays
+        for a dict and a sort.
+        """
+        line_numbers = [match.line_number for match in matches]
+        if all(map(le, line_numbers, line_numbers[1:])):
+            return [(line_number, list(group)) for line_number, group in groupby(matches, key=_line_number)]
+        
+        matches_by_line = defaultdict(list)
+        for match in matches:
+            matches_by_line[match.line_number].append(match)
+        return sorted(matches_by_line.items())
+    
+    @staticmethod
+    def format_count_result_stream(result: SearchResult) -> Iterator[str]:
+        """Yield count-only output lines, one per file.
+        
+        Only the per-file counts are read; matches are never grouped,
+        sorted or highlighted.
+        """
         # Single file: print only the number
         if len(result.file_matches) == 1:
             file_match = result.file_matches[0]
-            return str(file_match.match_count)
+            yield str(file_match.match_count)
+            return
         
         # Multiple files: print filename:count per file
-        lines = []
         for file_match in result.file_matches:
-            lines.append(f"{file_match.file_path}:{file_match.match_count}")
-        return '\n'.join(lines)
+            yield f"{file_match.file_path}:{file_match.match_count}"
     
-    def _format_match_line_group(self, matches: List[MatchResult], file_path: str, options: SearchOptions, show_filename: bool = False) -> str:
-        """Format a group of matches on the same line."""
+    def _format_match_line_group(self, matches: List[MatchResult], file_prefix: str, options: SearchOptions) -> str:
+        """Format a group of matches on the same line.
+        
+        file_prefix is the precomputed 'path:' part of the line prefix, or
+        an empty string when filenames are not shown.
+        """
         if not matches:
             return ""
         
@@ -116,45 +158,63 @@ class StandardOutputFormatter(OutputFormatter):
         if options.highlight_matches and not options.count_only:
             line_content = self.highlight_matches(matches, line_content)
         
-        # Format the line
-        prefix_parts = []
-        if show_filename:
-            prefix_parts.append(file_path)
-        prefix_parts.append(str(representative_match.line_number))
-        
-        prefix = ":".join(prefix_parts) + ":"
-        return f"{prefix}{line_content}"
+        return f"{file_prefix}{representative_match.line_number}:{line_content}"
     
     @staticmethod
     def highlight_matches(matches: List[MatchResult], line_content: str) -> str:
-        """Apply ANSI highlighting to matches in a line."""
+        """Apply ANSI highlighting to matches in a line.
+        
+        Overlapping or adjacent spans are merged, and the line is built in a
+        single forward pass over the sorted spans.
+        """
         if not matches:
             return line_content
         
-        # Sort matches by start position (reverse order for safe replacement)
-        sorted_matches = sorted(matches, key=lambda m: m.match_start, reverse=True)
+        if len(matches) == 1:
+            # The common case: one span, built in a single f-string
+            start, end = matches[0].match_start, matches[0].match_end
+            if end <= start:
+                return line_content
+            return f"{line_content[:start]}{HIGHLIGHT_START}{line_content[start:end]}{HIGHLIGHT_END}{line_content[end:]}"
+        
+        spans = sorted((m.match_start, m.match_end) for m in matches if m.match_end > m.match_start)
+        
+        parts = []
+        pos = 0
+        span_start, span_end = None, None
+        for start, end in spans:
+            if span_end is not None and start <= span_end:
+                # Overlaps or touches the current span; extend it
+                span_end = max(span_end, end)
+                continue
+            if span_end is not None:
+                parts += (line_content[pos:span_start], HIGHLIGHT_START,
+                          line_content[span_start:span_end], HIGHLIGHT_END)
+                pos = span_end
+            span_start, span_end = start, end
         
-        highlighted_content = line_content
-        for match in sorted_matches:
-            start = match.match_start
-            end = match.match_end
-            match_text = line_content[start:end]
-            highlighted_text = f"{ANSIColors.RED}{ANSIColors.BOLD}{match_text}{ANSIColors.RESET}"
-            highlighted_content = highlighted_content[:start] + highlighted_text + highlighted_content[end:]
+        if span_end is not None:
+            parts += (line_content[pos:span_start], HIGHLIGHT_START,
+                      line_content[span_start:span_end], HIGHLIGHT_END)
+            pos = span_end
+        parts.append(line_content[pos:])
         
-        return highlighted_content
+        return ''.join(parts)
     
-    def _format_with_context(self, file_match: FileMatch, options: SearchOptions, matches_by_line: Dict[int, List[MatchResult]], show_filename: bool = False) -> List[str]:
+    def _format_with_context(self, file_match: FileMatch, options: SearchOptions, line_groups: List[Tuple[int, List[MatchResult]]], show_filename: bool = False) -> List[str]:
         """Format matches with context lines."""
         output_lines = []
-        line_numbers = sorted(matches_by_line.keys())
+        previous_line_number = None
         
-        for i, line_number in enumerate(line_numbers):
-            matches = matches_by_line[line_number]
-            
+        # Filename parts of the prefixes, the same for every line of the file
+        file_prefix = f"{file_match.file_path}:" if show_filename else ""
+        context_prefix = f"{file_match.file_path}-" if show_filename else ""  # Use - for context lines
+        
+        for line_number, matches in line_groups:
             # Add separator if there's a gap between context groups
-            if i > 0 and line_number - line_numbers[i-1] > 1:
+            if previous_line_number is not None and line_number - previous_line_number > 1:
                 output_lines.append("--")
+            previous_line_number = line_number
             
             # Check if this is a context line or actual match
             is_context_line = all(m.match_start == -1 for m in matches)
@@ -162,18 +222,10 @@ class StandardOutputFormatter(OutputFormatter):
             if is_context_line:
                 # Format context line (no highlighting)
                 context_match = matches[0]
-                prefix_parts = []
-                if show_filename:
-                    prefix_parts.append(file_match.file_path)
-                prefix_parts.append(str(context_match.line_number))
-                prefix = "-".join(prefix_parts) + "-"  # Use - for context lines
-                formatted_line = f"{prefix}{context_match.line_content}"
-                output_lines.append(formatted_line)
+                output_lines.append(f"{context_prefix}{context_match.line_number}-{context_match.line_content}")
             else:
                 # Format actual match line (with highlighting)
-                formatted_line = self._format_match_line_group(
-                    matches, file_match.file_path, options, show_filename
-                )
+                formatted_line = self._format_match_line_group(matches, file_prefix, options)
                 if formatted_line:
                     output_lines.append(formatted_line)
         
@@ -185,20 +237,22 @@ class CompactOutputFormatter(OutputFormatter):
     
     def format_result(self, result: SearchResult, options: SearchOptions) -> str:
         """Format the complete search result for output."""
+        return '\n'.join(self.iter_format_result(result, options))
+    
+    def iter_format_result(self, result: SearchResult, options: SearchOptions) -> Iterator[str]:
+        """Yield the output lines of a search result one at a time."""
         if options.quiet:
-            return ""
+            return
         
         if options.count_only:
-            return str(result.total_matches)
+            yield str(result.total_matches)
+            return
         
-        output_lines = []
         for file_match in result.file_matches:
             if file_match.matches:
-                for match in file_match.matches:
-                    line = f"{file_match.file_path}:{match.line_number}:{match.line_content}"
-                    output_lines.append(line)
-        
-        return '\n'.join(output_lines)
+                prefix = f"{file_match.file_path}:"
+                for line_number, line_content in _line_items(file_match.matches):
+                    yield f"{prefix}{line_number}:{line_content}"
     
     def format_file_match(self, file_match: FileMatch, options: SearchOptions) -> str:
         """Format matches from a single file."""
@@ -1,75 +1,157 @@
 """Infrastructure implementation for parallel execution."""
 
-from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from abc import ABC, abstractmethod
+from concurrent.futures import Executor, ThreadPoolExecutor, as_completed
+from functools import partial
 from typing import List, Any, Callable, Optional
+import atexit
+import os
+import sys
 import threading
-import multiprocessing
 
 from ..domain.interfaces import ParallelExecutor
 
 
-class ThreadBasedExecutor(ParallelExecutor):
-    """Thread-based parallel executor implementation."""
+def _report_task_error(exc: Exception) -> None:
+    """Report a failed task on stderr, away from the formatted matches on stdout."""
+    print(f"prep: task generated an exception: {exc}", file=sys.stderr)
+
+
+def _call_safely(func: Callable[[Any], Any], item: Any) -> Any:
+    """Apply func to item, reporting any exception and returning None instead."""
+    try:
+        return func(item)
+    except Exception as exc:
+        _report_task_error(exc)
+        return None
+
+
+def _get_mp_context():
+    """Prefer fork where available so workers inherit compiled state copy-on-write."""
+    # Imported lazily: multiprocessing dominates start-up time of one-shot runs
+    import multiprocessing
+    
+    if 'fork' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('fork')
+    return None
+
+
+class _PooledExecutor(ParallelExecutor, ABC):
+    """Base for executors that keep one worker pool for the process lifetime.
+    
+    Starting a pool costs thread or process start-up on every call, so the
+    pool is created on first use and reused. It is only replaced when a
+    call asks for a different number of workers.
+    """
+    
+    def __init__(self):
+        self.__setstate__({})
+        atexit.register(self.shutdown)
+    
+    def __getstate__(self):
+        """Pickle without the pool; use cases holding an executor are sent to workers."""
+        return {}
+    
+    def __setstate__(self, state):
+        """Start without a pool; one is created on first use."""
+        self._pool = None
+        self._pool_size = 0
+        self._pool_lock = threading.Lock()
+    
+    @abstractmethod
+    def _create_pool(self, max_workers: int) -> Executor:
+        """Create a new pool with the given number of workers."""
+        pass
+    
+    def _get_pool(self, max_workers: Optional[int]) -> Executor:
+        """Get the shared pool, sized to max_workers (default: CPU count)."""
+        if max_workers is None:
+            max_workers = os.cpu_count() or 4
+        
+        with self._pool_lock:
+            if self._pool is None or self._pool_size != max_workers:
+                if self._pool is not None:
+                    self._pool.shutdown(wait=False)
+                self._pool = self._create_pool(max_workers)
+                self._pool_size = max_workers
+            return self._pool
+    
+    def shutdown(self) -> None:
+        """Shut down the shared pool; a later call starts a new one."""
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=True)
+                self._pool = None
+                self._pool_size = 0
     
     def execute_parallel(self, tasks: List[Callable], max_workers: Optional[int] = None) -> List[Any]:
-        """Execute tasks in parallel using threads."""
+        """Execute tasks in parallel on the shared pool."""
         if not tasks:
             return []
         
-        if max_workers is None:
-            max_workers = min(len(tasks), threading.active_count() + 4)
+        executor = self._get_pool(max_workers)
         
         results = []
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # Submit all tasks
-            future_to_task = {executor.submit(task): task for task in tasks}
-            
-            # Collect results as they complete
-            for future in as_completed(future_to_task):
-                try:
-                    result = future.result()
-                    results.append(result)
-                except Exception as exc:
-                    # Log the exception but continue with other tasks
-                    # In a real implementation, you might want to use proper logging
-                    print(f"Task generated an exception: {exc}")
-                    results.append(None)
+        # Submit all tasks; only the futures are needed to collect results
+        futures = [executor.submit(task) for task in tasks]
+        
+        # Collect results as they complete
+        for future in as_completed(futures):
+            try:
+                result = future.result()
+                results.append(result)
+            except Exception as exc:
+                # Log the exception but continue with other tasks
+                _report_task_error(exc)
+                results.append(None)
         
         return results
 
 
-class ProcessBasedExecutor(ParallelExecutor):
-    """Process-based parallel executor implementation."""
+class ThreadBasedExecutor(_PooledExecutor):
+    """Thread-based parallel executor implementation."""
     
-    def execute_parallel(self, tasks: List[Callable], max_workers: Optional[int] = None) -> List[Any]:
-        """Execute tasks in parallel using processes."""
-        if not tasks:
+    def _create_pool(self, max_workers: int) -> Executor:
+        """Create a thread pool; threads are only started as work arrives."""
+        return ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='prep')
+    
+    def execute_map(self, func: Callable[[Any], Any], items: List[Any], max_workers: Optional[int] = None) -> List[Any]:
+        """Apply func to items using threads, preserving input order."""
+        if not items:
             return []
         
-        if max_workers is None:
-            max_workers = min(len(tasks), multiprocessing.cpu_count())
+        return list(self._get_pool(max_workers).map(partial(_call_safely, func), items))
+
+
+class ProcessBasedExecutor(_PooledExecutor):
+    """Process-based parallel executor implementation."""
+    
+    def _create_pool(self, max_workers: int) -> Executor:
+        """Create a process pool, forking workers where the platform allows."""
+        from concurrent.futures import ProcessPoolExecutor
         
-        results = []
-        with ProcessPoolExecutor(max_workers=max_workers) as executor:
-            # Submit all tasks
-            future_to_task = {executor.submit(task): task for task in tasks}
-            
-            # Collect results as they complete
-            for future in as_completed(future_to_task):
-                try:
-                    result = future.result()
-                    results.append(result)
-                except Exception as exc:
-                    # Log the exception but continue with other tasks
-                    print(f"Task generated an exception: {exc}")
-                    results.append(None)
+        return ProcessPoolExecutor(max_workers=min(32, max_workers), mp_context=_get_mp_context())
+    
+    def execute_map(self, func: Callable[[Any], Any], items: List[Any], max_workers: Optional[int] = None) -> List[Any]:
+        """Apply func to items using processes, preserving input order.
         
-        return results
+        Items are dispatched in chunks so each worker amortizes the pickling
+        and IPC overhead over several items. func must be picklable.
+        """
+        if not items:
+            return []
+        
+        executor = self._get_pool(max_workers)
+        chunksize = max(1, len(items) // (4 * min(32, max_workers or os.cpu_count() or 4)))
+        return list(executor.map(partial(_call_safely, func), items, chunksize=chunksize))
 
 
 class AdaptiveExecutor(ParallelExecutor):
     """Adaptive executor that chooses the best strategy based on task characteristics."""
     
+    # Above this many items, regex matching outweighs process start-up cost
+    PROCESS_THRESHOLD = 8
+    
     def __init__(self):
         self._thread_executor = ThreadBasedExecutor()
         self._process_executor = ProcessBasedExecutor()
@@ -82,6 +164,17 @@ class AdaptiveExecutor(ParallelExecutor):
         # Use threads for I/O-bound tasks (file reading) and processes for CPU-bound tasks
         # For grep operations, file I/O is typically the bottleneck, so use threads
         return self._thread_executor.execute_parallel(tasks, max_workers)
+    
+    def execute_map(self, func: Callable[[Any], Any], items: List[Any], max_workers: Optional[int] = None) -> List[Any]:
+        """Apply func to items, using processes for large batches."""
+        if not items:
+            return []
+        
+        # Matching is CPU-bound and threads serialize on the GIL, so large
+        # batches go to a process pool; small ones are not worth the start-up
+        if (max_workers is None or max_workers > 1) and len(items) > self.PROCESS_THRESHOLD:
+            return self._process_executor.execute_map(func, items, max_workers)
+        return self._thread_executor.execute_map(func, items, max_workers)
 
 
 class SequentialExecutor(ParallelExecutor):
@@ -95,7 +188,11 @@ class SequentialExecutor(ParallelExecutor):
                 result = task()
                 results.append(result)
             except Exception as exc:
-                print(f"Task generated an exception: {exc}")
+                _report_task_error(exc)
                 results.append(None)
         
-        return results
\ No newline at end of file
+        return results
+    
+    def execute_map(self, func: Callable[[Any], Any], items: List[Any], max_workers: Optional[int] = None) -> List[Any]:
+        """Apply func to items sequentially."""
+        return [_call_safely(func, item) for item in items]
@@ -1,80 +1,131 @@
 """Infrastructure implementation for pattern matching operations."""
 
 import re
-from typing import List, Optional
+from dataclasses import replace
+from typing import Callable, Dict, List, Optional, Pattern, Tuple
 
 from ..domain.interfaces import PatternMatcher
-from ..domain.models import SearchOptions, MatchResult
-from .boolean_parser import parse_boolean_pattern, BooleanNode
+from ..domain.models import SearchOptions, SearchPattern, MatchResult, compile_regex
+from .boolean_parser import (
+    parse_boolean_pattern, has_boolean_operators, extract_required_literal, BooleanNode, CompiledExpression
+)
+
+
+# Constructs that can see past the end of a line when a pattern searches a
+# whole block: string anchors, lookarounds, atomic or possessive repeats and
+# scoped flags that could turn MULTILINE off
+_BLOCK_UNSAFE = re.compile(r'\\[AZ]|\(\?[=!<>]|[*+?}]\+|\(\?\w*-')
 
 
 class BooleanPatternMatcher(PatternMatcher):
     """Pattern matcher with Boolean expression support."""
     
+    def __init__(self):
+        self._trees: Dict[SearchPattern, Optional[BooleanNode]] = {}
+        self._programs: Dict[SearchPattern, CompiledExpression] = {}
+        self._highlighters: Dict[SearchPattern, List[Tuple[Optional[str], Callable]]] = {}
+    
     def find_matches(self, content: str, line_number: int, options: SearchOptions) -> List[MatchResult]:
         """Find all matches in a line of content using Boolean expressions."""
         matches = []
         
         for pattern in options.patterns:
-            # Parse the pattern as a Boolean expression
-            bool_tree = parse_boolean_pattern(pattern.pattern)
+            # Parse the pattern as a Boolean expression (once per pattern)
+            bool_tree = self._get_tree(pattern)
             
             if bool_tree is None:
                 continue
             
-            # Apply match type modifications to the pattern before evaluation
-            modified_pattern = pattern.pattern
-            if pattern.match_type.value == "word":
-                # For word matching, wrap entire boolean expression patterns
-                modified_pattern = self._apply_word_boundaries_to_tree(bool_tree)
-            elif pattern.match_type.value == "line":
-                # For line matching, wrap entire boolean expression patterns
-                modified_pattern = self._apply_line_anchors_to_tree(bool_tree)
-            
-            # Re-parse with modified patterns if match_type is applied
-            if pattern.match_type.value != "normal":
-                bool_tree = self._create_modified_tree(bool_tree, pattern.match_type)
-            
             # Check if the line matches the Boolean expression
-            line_matches = bool_tree.evaluate(content, pattern.regex_flags)
+            line_matches = self._get_program(pattern, bool_tree).evaluate(content)
             
             if not line_matches:
                 continue
             
-            # Find all literal patterns in the tree for highlighting
-            literal_patterns = bool_tree.get_patterns()
-            
-            # For each literal pattern, find actual match positions for highlighting
-            # Only highlight patterns that actually match in the content
-            for literal_pattern in literal_patterns:
-                try:
-                    # Apply match type modifications
-                    if pattern.match_type.value == "word":
-                        search_pattern = rf"\b(?:{literal_pattern})\b"
-                    elif pattern.match_type.value == "line":
-                        search_pattern = rf"^(?:{literal_pattern})$"
-                    else:
-                        search_pattern = literal_pattern
-                    
-                    compiled = re.compile(search_pattern, pattern.regex_flags)
-                    
-                    # Only add matches if this pattern actually appears in the line
-                    pattern_matches = list(compiled.finditer(content))
-                    if pattern_matches:
-                        for match in pattern_matches:
-                            match_result = MatchResult(
-                                line_number=line_number,
-                                line_content=content,
-                                match_start=match.start(),
-                                match_end=match.end(),
-                                pattern=pattern
-                            )
-                            matches.append(match_result)
-                except re.error:
+            # Find actual match positions of each literal for highlighting;
+            # only literals that appear in the line produce matches, and a
+            # span found by several literals is reported once
+            seen_spans = set()
+            for hint, finditer in self._get_highlighters(pattern, bool_tree):
+                # A literal whose required substring is absent cannot match
+                if hint is not None and hint not in content:
                     continue
+                for match in finditer(content):
+                    span = match.span()
+                    if span not in seen_spans:
+                        seen_spans.add(span)
+                        matches.append(MatchResult(line_number, content, span[0], span[1], pattern))
         
         return matches
     
+    def has_any_match(self, content: str, options: SearchOptions) -> bool:
+        """Check whether find_matches would report anything for a line.
+        
+        A true expression always has a matching literal unless negation
+        made it true; only then are the literals searched for highlighting.
+        """
+        for pattern in options.patterns:
+            bool_tree = self._get_tree(pattern)
+            if bool_tree is None or not self._get_program(pattern, bool_tree).evaluate(content):
+                continue
+            if bool_tree.requires_match() or self.find_matches(content, 0, replace(options, patterns=[pattern])):
+                return True
+        return False
+    
+    def _get_tree(self, pattern: SearchPattern) -> Optional[BooleanNode]:
+        """Get the expression tree with the match type applied to its literals.
+        
+        Trees are cached per pattern so their literal nodes keep their
+        compiled regexes across lines and files.
+        """
+        try:
+            return self._trees[pattern]
+        except KeyError:
+            pass
+        
+        bool_tree = parse_boolean_pattern(pattern.pattern)
+        
+        # Apply match type modifications to the literals before evaluation
+        if bool_tree is not None and pattern.match_type.value != "normal":
+            bool_tree = self._create_modified_tree(bool_tree, pattern.match_type)
+        
+        self._trees[pattern] = bool_tree
+        return bool_tree
+    
+    def _get_program(self, pattern: SearchPattern, bool_tree: BooleanNode) -> CompiledExpression:
+        """Get the flattened, compiled form of a pattern's expression tree."""
+        try:
+            return self._programs[pattern]
+        except KeyError:
+            program = self._programs[pattern] = CompiledExpression(bool_tree, pattern.regex_flags)
+            return program
+    
+    def _get_highlighters(self, pattern: SearchPattern, bool_tree: BooleanNode) -> List[Tuple[Optional[str], Callable]]:
+        """Get the required substring and finditer function of each distinct literal.
+        
+        Compiling the literals depends only on the pattern, so it is done
+        once instead of on every matching line. The tree's literals already
+        carry the match type (see _get_tree), so they share their compiled
+        regex with evaluation. Literals that are not valid regexes are left
+        out.
+        """
+        try:
+            return self._highlighters[pattern]
+        except KeyError:
+            pass
+        
+        highlighters = []
+        for literal_pattern in dict.fromkeys(bool_tree.get_patterns()):
+            try:
+                finditer = compile_regex(literal_pattern, pattern.regex_flags).finditer
+            except re.error:
+                continue
+            hint, _ = extract_required_literal(literal_pattern, pattern.regex_flags)
+            highlighters.append((hint, finditer))
+        
+        self._highlighters[pattern] = highlighters
+        return highlighters
+    
     def _create_modified_tree(self, tree: BooleanNode, match_type) -> BooleanNode:
         """Create a new tree with match type applied to all literal nodes."""
         from .boolean_parser import LiteralNode, AndNode, OrNode, NotNode
@@ -90,16 +141,15 @@ class BooleanPatternMatcher(PatternMatcher):
             return LiteralNode(modified_pattern)
         elif isinstance(tree, NotNode):
             return NotNode(self._create_modified_tree(tree.child, match_type))
-        elif isinstance(tree, AndNode):
-            return AndNode(
-                self._create_modified_tree(tree.left, match_type),
-                self._create_modified_tree(tree.right, match_type)
-            )
-        elif isinstance(tree, OrNode):
-            return OrNode(
+        elif isinstance(tree, (AndNode, OrNode)):
+            modified = type(tree)(
                 self._create_modified_tree(tree.left, match_type),
                 self._create_modified_tree(tree.right, match_type)
             )
+            # Keep the evaluation order chosen by the parser
+            if tree.ordered[0] is tree.right:
+                modified.ordered = (modified.right, modified.left)
+            return modified
         return tree
     
     def _apply_word_boundaries_to_tree(self, tree: BooleanNode) -> str:
@@ -126,25 +176,66 @@ class BooleanPatternMatcher(PatternMatcher):
 class RegexPatternMatcher(PatternMatcher):
     """Regex-based pattern matcher implementation."""
     
+    def __init__(self):
+        self._block_searches: Dict[SearchPattern, Tuple[Optional[str], Optional[Pattern[str]]]] = {}
+    
     def find_matches(self, content: str, line_number: int, options: SearchOptions) -> List[MatchResult]:
         """Find all matches in a line of content."""
         matches = []
+        append = matches.append
         
         for pattern in options.patterns:
-            compiled_pattern = pattern.compile()
+            # Memoized on the pattern; compile() only runs on first use
+            compiled_pattern = pattern.compiled or pattern.compile()
             
             for match in compiled_pattern.finditer(content):
-                match_result = MatchResult(
-                    line_number=line_number,
-                    line_content=content,
-                    match_start=match.start(),
-                    match_end=match.end(),
-                    pattern=pattern
-                )
-                matches.append(match_result)
+                match_start, match_end = match.span()
+                append(MatchResult(line_number, content, match_start, match_end, pattern))
         
         return matches
     
+    def has_any_match(self, content: str, options: SearchOptions) -> bool:
+        """Check whether any pattern matches a line, stopping at the first hit."""
+        for pattern in options.patterns:
+            compiled_pattern = pattern.compiled or pattern.compile()
+            if compiled_pattern.search(content) is not None:
+                return True
+        return False
+    
+    def may_match_block(self, text: str, options: SearchOptions) -> bool:
+        """Check whether any line of a block could match, with one search per pattern."""
+        for pattern in options.patterns:
+            try:
+                hint, block_regex = self._block_searches[pattern]
+            except KeyError:
+                hint, block_regex = self._get_block_search(pattern)
+            if hint is not None and hint not in text:
+                # Every match contains the hint; none can be in this block
+                continue
+            if block_regex is None or block_regex.search(text) is not None:
+                return True
+        return False
+    
+    def _get_block_search(self, pattern: SearchPattern) -> Tuple[Optional[str], Optional[Pattern[str]]]:
+        """Prepare the required literal and block regex of a pattern, once.
+        
+        The literal rules blocks out with a plain substring test, which is
+        much cheaper than a regex search when the pattern does not start
+        with a literal. With re.MULTILINE, ^ and $ match at every line
+        boundary, so text that matches within its own line also matches
+        within the block. Patterns using constructs that can look past a
+        line get no block regex and are always searched line by line.
+        """
+        hint, _ = extract_required_literal(pattern.pattern, pattern.regex_flags)
+        
+        compiled_pattern = pattern.compiled or pattern.compile()
+        block_regex = None
+        if isinstance(compiled_pattern, re.Pattern) and not _BLOCK_UNSAFE.search(compiled_pattern.pattern):
+            block_regex = compile_regex(compiled_pattern.pattern, compiled_pattern.flags | re.MULTILINE)
+        
+        block_search = self._block_searches[pattern] = (hint, block_regex)
+        return block_search
+    
     def should_include_line(self, matches: List[MatchResult], options: SearchOptions) -> bool:
         """Determine if a line should be included based on matches and options."""
         has_matches = bool(matches)
@@ -156,54 +247,155 @@ class RegexPatternMatcher(PatternMatcher):
 
 
 class SimplePatternMatcher(PatternMatcher):
-    """Simple string-based pattern matcher for non-regex patterns."""
+    """Simple string-based pattern matcher for non-regex patterns.
+    
+    A fixed-string pattern may list several alternatives separated by an
+    unescaped ``|``. Case-sensitive alternatives outside word mode are
+    found with plain string search; the others are escaped into their own
+    regex once, so scanning a line runs in the C regex engine.
+    """
+    
+    def __init__(self):
+        self._needles: Dict[SearchPattern, Tuple[str, ...]] = {}
+        self._regexes: Dict[SearchPattern, Tuple[Tuple[Optional[str], Optional[Callable], Optional[Pattern[str]]], ...]] = {}
     
     def find_matches(self, content: str, line_number: int, options: SearchOptions) -> List[MatchResult]:
         """Find all matches in a line of content using simple string matching."""
         matches = []
+        append = matches.append
         
         for pattern in options.patterns:
             if pattern.is_regex:
                 # Skip regex patterns in simple matcher - they should be handled by regex matcher
                 continue
             
-            search_text = pattern.pattern
-            search_content = content
+            try:
+                regexes = self._regexes[pattern]
+            except KeyError:
+                regexes = self._get_regexes(pattern)
             
-            # Apply case-insensitive matching if specified
-            if pattern.regex_flags & re.IGNORECASE:
-                search_text = search_text.lower()
-                search_content = search_content.lower()
+            if pattern.match_type.value == "line":
+                # Whole line must equal the literal
+                for needle, _, regex in regexes:
+                    if (content == needle) if regex is None else (regex.fullmatch(content) is not None):
+                        append(MatchResult(line_number, content, 0, len(content), pattern))
+                continue
             
-            start = 0
-            while True:
-                pos = search_content.find(search_text, start)
-                if pos == -1:
-                    break
+            for needle, probe, regex in regexes:
+                if regex is None:
+                    # Plain substring: step over each non-overlapping occurrence
+                    match_start = content.find(needle)
+                    while match_start != -1:
+                        match_end = match_start + len(needle)
+                        append(MatchResult(line_number, content, match_start, match_end, pattern))
+                        match_start = content.find(needle, match_end)
+                    continue
                 
-                # Check word boundaries for word match
-                if pattern.match_type.value == "word":
-                    if not self._is_word_boundary(content, pos, pos + len(search_text)):
-                        start = pos + 1
+                # Most lines do not match; rule them out before finditer
+                if needle is not None:
+                    if needle not in content:
                         continue
-                
-                # Check line match
-                if pattern.match_type.value == "line":
-                    if content.strip() != pattern.pattern:
-                        break
-                
-                match_result = MatchResult(
-                    line_number=line_number,
-                    line_content=content,
-                    match_start=pos,
-                    match_end=pos + len(search_text),
-                    pattern=pattern
-                )
-                matches.append(match_result)
-                start = pos + 1
+                elif probe is not None and probe(content) is None:
+                    continue
+                for match in regex.finditer(content):
+                    match_start, match_end = match.span()
+                    append(MatchResult(line_number, content, match_start, match_end, pattern))
         
         return matches
     
+    def has_any_match(self, content: str, options: SearchOptions) -> bool:
+        """Check whether any fixed string occurs in a line, stopping at the first hit."""
+        for pattern in options.patterns:
+            if pattern.is_regex:
+                continue
+            
+            try:
+                regexes = self._regexes[pattern]
+            except KeyError:
+                regexes = self._get_regexes(pattern)
+            
+            line_match = pattern.match_type.value == "line"
+            for needle, probe, regex in regexes:
+                if regex is None:
+                    if (content == needle) if line_match else (needle in content):
+                        return True
+                    continue
+                if line_match:
+                    if regex.fullmatch(content) is not None:
+                        return True
+                    continue
+                if needle is not None and needle not in content:
+                    continue
+                if regex.search(content) is not None:
+                    return True
+        return False
+    
+    def may_match_block(self, text: str, options: SearchOptions) -> bool:
+        """Check whether any fixed string occurs anywhere in a block of lines."""
+        for pattern in options.patterns:
+            if pattern.is_regex:
+                continue
+            
+            try:
+                regexes = self._regexes[pattern]
+            except KeyError:
+                regexes = self._get_regexes(pattern)
+            
+            # Word and whole-line checks only narrow a plain occurrence
+            for needle, probe, regex in regexes:
+                if needle is not None:
+                    if needle in text:
+                        return True
+                elif (probe or regex.search)(text) is not None:
+                    return True
+        return False
+    
+    def _get_regexes(self, pattern: SearchPattern) -> Tuple[Tuple[Optional[str], Optional[Callable], Optional[Pattern[str]]], ...]:
+        """Compile each alternative of a fixed-string pattern, once.
+        
+        Case-sensitive alternatives outside word mode need no regex at all
+        (None); str.find and == match them directly. For case-sensitive
+        word matches, a plain substring check rules out most lines before
+        the regex runs. Case-insensitive word matches get a search of
+        the escaped literal as their probe instead, since their lookarounds
+        (rejecting a word character on either side) defeat the engine's
+        literal search.
+        """
+        flags = pattern.regex_flags & re.IGNORECASE
+        word = pattern.match_type.value == "word"
+        regexes = []
+        for needle in self._get_needles(pattern):
+            if not flags and not word:
+                regexes.append((needle, None, None))
+                continue
+            literal = re.escape(needle)
+            if word:
+                regex = compile_regex(rf"(?<!\w){literal}(?!\w)", flags)
+            else:
+                regex = compile_regex(literal, flags)
+            probe = compile_regex(literal, flags).search if flags and word else None
+            regexes.append((None if flags else needle, probe, regex))
+        
+        regexes = self._regexes[pattern] = tuple(regexes)
+        return regexes
+    
+    def _get_needles(self, pattern: SearchPattern) -> Tuple[str, ...]:
+        """Split a fixed-string pattern into its literal alternatives, once."""
+        try:
+            return self._needles[pattern]
+        except KeyError:
+            pass
+        
+        alternatives = [
+            literal.replace('\\|', '|')
+            for literal in re.split(r'(?<!\\)\|', pattern.pattern)
+        ]
+        
+        # Empty alternatives would match everywhere; drop them and duplicates
+        needles = tuple(dict.fromkeys(literal for literal in alternatives if literal))
+        self._needles[pattern] = needles
+        return needles
+    
     def should_include_line(self, matches: List[MatchResult], options: SearchOptions) -> bool:
         """Determine if a line should be included based on matches and options."""
         has_matches = bool(matches)
@@ -212,19 +404,6 @@ class SimplePatternMatcher(PatternMatcher):
             return not has_matches
         else:
             return has_matches
-    
-    @staticmethod
-    def _is_word_boundary(text: str, start: int, end: int) -> bool:
-        """Check if the match is at word boundaries."""
-        # Check start boundary
-        if start > 0 and text[start - 1].isalnum():
-            return False
-        
-        # Check end boundary
-        if end < len(text) and text[end].isalnum():
-            return False
-        
-        return True
 
 
 class HybridPatternMatcher(PatternMatcher):
@@ -232,12 +411,96 @@ class HybridPatternMatcher(PatternMatcher):
     
     def __init__(self):
         self._boolean_matcher = BooleanPatternMatcher()
+        self._simple_matcher = SimplePatternMatcher()
+        self._regex_matcher = RegexPatternMatcher()
+        # Dispatch plan of the most recently seen options, keyed by identity
+        self._last_plan: Tuple[Optional[SearchOptions], List[Tuple[PatternMatcher, SearchOptions]]] = (None, [])
     
     def find_matches(self, content: str, line_number: int, options: SearchOptions) -> List[MatchResult]:
-        """Find all matches using Boolean pattern matcher."""
-        # BooleanPatternMatcher handles both simple patterns and Boolean expressions
-        return self._boolean_matcher.find_matches(content, line_number, options)
+        """Find all matches, dispatching each pattern to the cheapest matcher."""
+        planned_options, plan = self._last_plan
+        if planned_options is not options:
+            plan = self._plan(options)
+            self._last_plan = (options, plan)
+        
+        if len(plan) == 1:
+            matcher, matcher_options = plan[0]
+            return matcher.find_matches(content, line_number, matcher_options)
+        
+        matches = []
+        for matcher, matcher_options in plan:
+            matches.extend(matcher.find_matches(content, line_number, matcher_options))
+        return matches
+    
+    def has_any_match(self, content: str, options: SearchOptions) -> bool:
+        """Check whether any pattern matches a line, stopping at the first hit."""
+        planned_options, plan = self._last_plan
+        if planned_options is not options:
+            plan = self._plan(options)
+            self._last_plan = (options, plan)
+        
+        for matcher, matcher_options in plan:
+            if matcher.has_any_match(content, matcher_options):
+                return True
+        return False
+    
+    def may_match_block(self, text: str, options: SearchOptions) -> bool:
+        """Check whether any line of a block could match any pattern."""
+        planned_options, plan = self._last_plan
+        if planned_options is not options:
+            plan = self._plan(options)
+            self._last_plan = (options, plan)
+        
+        for matcher, matcher_options in plan:
+            if matcher.may_match_block(text, matcher_options):
+                return True
+        return False
+    
+    def _plan(self, options: SearchOptions) -> List[Tuple[PatternMatcher, SearchOptions]]:
+        """Group the patterns by matcher, with options narrowed to each group.
+        
+        A search passes the same options for every line, so the plan is
+        built once instead of per line.
+        """
+        if len(options.patterns) == 1:
+            return [(self._matcher_for(options.patterns[0]), options)]
+        
+        grouped: Dict[int, Tuple[PatternMatcher, List[SearchPattern]]] = {}
+        for pattern in options.patterns:
+            matcher = self._matcher_for(pattern)
+            grouped.setdefault(id(matcher), (matcher, []))[1].append(pattern)
+        
+        return [(matcher, replace(options, patterns=patterns)) for matcher, patterns in grouped.values()]
+    
+    def _matcher_for(self, pattern: SearchPattern) -> PatternMatcher:
+        """Choose the matcher for a single pattern."""
+        if not pattern.is_regex:
+            # Fixed strings never need the regex engine
+            return self._simple_matcher
+        
+        if pattern.engine != 're':
+            # Compiled by an alternative engine (e.g. re2); use it directly
+            return self._regex_matcher
+        
+        if pattern.pattern.strip() and not has_boolean_operators(pattern.pattern) and self._compiles(pattern):
+            # A plain regex needs no expression tree; one finditer does it all
+            return self._regex_matcher
+        
+        # BooleanPatternMatcher handles Boolean expressions, and patterns
+        # that are not valid regexes leniently (they never match)
+        return self._boolean_matcher
+    
+    @staticmethod
+    def _compiles(pattern: SearchPattern) -> bool:
+        """Check whether a pattern is a valid regex; parse_args usually compiled it already."""
+        if pattern.compiled is not None:
+            return True
+        try:
+            pattern.compile()
+        except re.error:
+            return False
+        return True
     
     def should_include_line(self, matches: List[MatchResult], options: SearchOptions) -> bool:
         """Determine if a line should be included based on matches and options."""
-        return self._boolean_matcher.should_include_line(matches, options)
\ No newline at end of file
+        return bool(matches) != options.invert_match
@@ -2,6 +2,7 @@
 
 import signal
 import sys
+from contextlib import ExitStack
 
 from ..domain.interfaces import FileWatcher, PatternMatcher, OutputFormatter
 from ..domain.models import SearchOptions
@@ -29,10 +30,6 @@ class FileWatchUseCase:
         self.pattern_matcher = pattern_matcher
         self.output_formatter = output_formatter
         self._stop_requested = False
-        
-        # Set up signal handlers for graceful shutdown
-        signal.signal(signal.SIGINT, self._signal_handler)
-        signal.signal(signal.SIGTERM, self._signal_handler)
     
     def _signal_handler(self, signum, frame):
         """Handle shutdown signals."""
@@ -50,7 +47,20 @@ class FileWatchUseCase:
         Returns:
             Exit code (0 if matches found, 1 if no matches)
         """
+        # Handle shutdown signals only while watching, then restore the
+        # previous handlers
+        self._stop_requested = False
+        with ExitStack() as stack:
+            for signum in (signal.SIGINT, signal.SIGTERM):
+                stack.callback(signal.signal, signum, signal.signal(signum, self._signal_handler))
+            return self._watch(file_path, options)
+    
+    def _watch(self, file_path: str, options: SearchOptions) -> int:
+        """Watch and search a file, returning the exit code."""
         try:
+            if options.quiet:
+                return 0 if self._watch_quietly(file_path, options) else 1
+            
             # Initialize context buffer
             context_buffer = ContextBuffer(
                 before_lines=options.context_before,
@@ -59,52 +69,58 @@ class FileWatchUseCase:
             
             line_number = 0
             matches_found = False
+            # Only before-context needs the lines seen so far
+            keep_lines = options.context_before > 0
+            
+            # Bind everything the per-line loop uses; quiet mode never gets here
+            find_matches = self.pattern_matcher.find_matches
+            should_include_line = self.pattern_matcher.should_include_line
+            highlight = options.highlight_matches and not options.count_only
+            highlight_matches = self.output_formatter.highlight_matches if highlight else None
+            get_context_for_match = context_buffer.get_context_for_match
+            get_after_context_line = context_buffer.get_after_context_line
+            add_line = context_buffer.add_line
+            write = sys.stdout.write
 
-            # Start watching the file
-            for line in self.file_watcher.watch_file(file_path):
-                if self._stop_requested:
-                    break
-                
-                line_number += 1
-                
-                # Check for pattern matches BEFORE adding to buffer
-                matches = self.pattern_matcher.find_matches(line, line_number, options)
-                should_include = self.pattern_matcher.should_include_line(matches, options)
-                
-                if should_include:
-                    matches_found = True
+            # Start watching the file; lines arrive in batches, one per read
+            for lines in self.file_watcher.watch_file_batches(file_path):
+                for line in lines:
+                    if self._stop_requested:
+                        break
+                    
+                    line_number += 1
                     
-                    if not options.quiet:
-                        # Get context for this match (buffer has lines BEFORE current line)
-                        context = context_buffer.get_context_for_match(line_number, line)
+                    # Check for pattern matches BEFORE adding to buffer
+                    matches = find_matches(line, line_number, options)
+                    
+                    if should_include_line(matches, options):
+                        matches_found = True
                         
-                        # Print before context
-                        for before_line_num, before_line in context['before']:
-                            self._print_context_line(
-                                before_line
-                            )
+                        # Print before context (buffer has lines BEFORE current line)
+                        for _, before_line in get_context_for_match(line_number, line)['before']:
+                            write(f"{before_line}\n")
                         
                         # Print the matching line with highlighting - clean output like tail -f | grep
-                        highlighted_line = line
-                        if options.highlight_matches and not options.count_only:
-                            # Apply highlighting using the output formatter's method
-                            highlighted_line = self.output_formatter.highlight_matches(matches, line)
-                        print(highlighted_line, flush=True)
-                
-                else:
-                    # Check if this line should be included as after-context
-                    should_include_after, line_info = context_buffer.get_after_context_line(
-                        line_number, line
-                    )
+                        if highlight_matches is not None:
+                            write(f"{highlight_matches(matches, line)}\n")
+                        else:
+                            write(f"{line}\n")
+                    
+                    else:
+                        # Check if this line should be included as after-context
+                        should_include_after, line_info = get_after_context_line(line_number, line)
+                        if should_include_after:
+                            write(f"{line_info[1]}\n")
                     
-                    if should_include_after and not options.quiet:
-                        line_num, line_content = line_info
-                        self._print_context_line(
-                            line_content
-                        )
+                    # Add line to buffer AFTER processing (for future before context)
+                    if keep_lines:
+                        add_line(line)
                 
-                # Add line to buffer AFTER processing (for future before context)
-                context_buffer.add_line(line)
+                # The watcher waits for new data next; show this batch now
+                # with one flush instead of one per line
+                sys.stdout.flush()
+                if self._stop_requested:
+                    break
             
             return 0 if matches_found else 1
             
@@ -117,11 +133,24 @@ class FileWatchUseCase:
             print(f"prep: error watching file: {e}", file=sys.stderr)
             return 2
     
-    @staticmethod
-    def _print_context_line(line_content: str) -> None:
-        """Print a context line (before or after a match)."""
-        # In file watching mode, print clean output without prefixes like tail -f | grep
-        print(line_content, flush=True)
+    def _watch_quietly(self, file_path: str, options: SearchOptions) -> bool:
+        """Watch a file without printing, returning whether any line was selected.
+        
+        Nothing is shown in quiet (and count) mode, so each line only needs
+        a yes/no answer from the matcher; no matches or context are built.
+        """
+        has_any_match = self.pattern_matcher.has_any_match
+        invert_match = options.invert_match
+        matches_found = False
+        
+        for lines in self.file_watcher.watch_file_batches(file_path):
+            for line in lines:
+                if self._stop_requested:
+                    return matches_found
+                if has_any_match(line, options) != invert_match:
+                    matches_found = True
+        
+        return matches_found
 
 
 class FileWatchCountUseCase:
@@ -1,13 +1,14 @@
 """Use cases for search operations in prep."""
 
-from typing import List, Optional
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import replace
+from typing import Iterator, List, Optional, Tuple
+from functools import partial
 
 from ..domain.interfaces import (
     FileReader, FileScanner, PatternMatcher, SearchService, ParallelExecutor
 )
 from ..domain.models import (
-    SearchOptions, SearchResult, FileMatch, MatchResult, SearchPattern
+    SearchOptions, SearchResult, FileMatch, MatchResult, MatchTable, SearchPattern
 )
 from ..infrastructure.chronological_merge import merge_chronologically
 
@@ -43,86 +44,48 @@ class SearchUseCase:
     
     def _search_sequential(self, file_paths: List[str], options: SearchOptions) -> SearchResult:
         """Search files sequentially."""
-        file_matches = []
-        total_matches = 0
-        files_with_matches = 0
-        
+        results = []
         for file_path in file_paths:
             file_match = self._search_single_file(file_path, options)
-            if file_match.matches or not options.quiet:
-                file_matches.append(file_match)
+            results.append(file_match)
             
-            if file_match.matches:
-                files_with_matches += 1
-                total_matches += len(file_match.matches)
-                
-                # Early exit for quiet mode
-                if options.quiet:
-                    break
-        
-        result = SearchResult(
-            file_matches=file_matches,
-            total_matches=total_matches,
-            files_with_matches=files_with_matches
-        )
-        
-        # Apply chronological merging for multi-file searches (not in count mode)
-        if len(file_paths) > 1 and not options.count_only:
-            result = merge_chronologically(result)
+            # Early exit for quiet mode
+            if options.quiet and file_match.matches:
+                break
         
-        return result
+        return self._collect_results(results, options, len(file_paths) > 1)
     
     def _search_parallel(self, file_paths: List[str], options: SearchOptions) -> SearchResult:
-        """Search files in parallel."""
-        file_matches = []
-        total_matches = 0
-        files_with_matches = 0
-        
-        def search_file(file_path: str) -> FileMatch:
-            return self._search_single_file(file_path, options)
-        
-        # Create tasks for parallel execution
-        tasks = [lambda fp=file_path: search_file(fp) for file_path in file_paths]
-        
-        if self._parallel_executor:
-            results = self._parallel_executor.execute_parallel(tasks, options.max_threads)
-        else:
-            # Fallback to ThreadPoolExecutor
-            with ThreadPoolExecutor(max_workers=options.max_threads) as executor:
-                future_to_file = {executor.submit(search_file, fp): fp for fp in file_paths}
-                results = []
-                
-                for future in as_completed(future_to_file):
-                    try:
-                        result = future.result()
-                        results.append(result)
-                        
-                        # Early exit for quiet mode
-                        if options.quiet and result.matches:
-                            # Cancel remaining futures
-                            for f in future_to_file:
-                                f.cancel()
-                            break
-                    except Exception as exc:
-                        # Log error but continue with other files
-                        continue
-        
-        for file_match in results:
-            if file_match.matches or not options.quiet:
-                file_matches.append(file_match)
-            
-            if file_match.matches:
-                files_with_matches += 1
-                total_matches += len(file_match.matches)
-        
+        """Search files in parallel on the configured executor."""
+        # The executor keeps its worker pool across calls (no per-search
+        # thread start-up) and dispatches files in chunks. A bound method
+        # plus partial stays picklable for process-based executors
+        search_file = partial(self._search_single_file, options=options)
+        
+        # Any match settles a quiet search, so its files go out in rounds of
+        # a few per worker and the remaining rounds are skipped after a hit
+        step = 4 * options.max_threads if options.quiet else len(file_paths)
+        results = []
+        for start in range(0, len(file_paths), step):
+            batch = self._parallel_executor.execute_map(search_file, file_paths[start:start + step], options.max_threads)
+            # Failed tasks are reported by the executor and come back as None
+            results.extend(file_match for file_match in batch if file_match is not None)
+            if options.quiet and any(file_match.matches for file_match in results):
+                break
+        
+        return self._collect_results(results, options, len(file_paths) > 1)
+    
+    @staticmethod
+    def _collect_results(results: List[FileMatch], options: SearchOptions, multi_file: bool) -> SearchResult:
+        """Aggregate per-file matches into a search result."""
         result = SearchResult(
-            file_matches=file_matches,
-            total_matches=total_matches,
-            files_with_matches=files_with_matches
+            file_matches=[fm for fm in results if fm.matches or not options.quiet],
+            total_matches=sum(len(fm.matches) for fm in results),
+            files_with_matches=sum(1 for fm in results if fm.matches)
         )
         
         # Apply chronological merging for multi-file searches (not in count mode)
-        if len(file_paths) > 1 and not options.count_only:
+        if multi_file and not options.count_only:
             result = merge_chronologically(result)
         
         return result
@@ -137,58 +100,87 @@ class SearchUseCase:
         if is_binary and options.ignore_binary:
             return FileMatch(file_path=file_path, matches=[], is_binary=True)
         
-        matches = []
+        matches = MatchTable()
         try:
             # Read all lines if context is needed
             if options.context_before > 0 or options.context_after > 0:
                 all_lines = list(self._file_reader.read_lines(file_path))
                 matches = self._search_with_context(all_lines, options)
+            elif options.invert_match or options.count_only or options.quiet or not options.highlight_matches:
+                # Match positions are only used for highlighting; without it
+                # only whether each line matched matters, so stop at the
+                # first hit per line
+                pattern = options.patterns[0] if options.patterns else None
+                has_any_match = self._pattern_matcher.has_any_match
+                add = matches.add
+                # -c and -q only report how many lines were selected; their
+                # text is not kept alive or sent back from worker processes
+                keep_content = not (options.count_only or options.quiet)
+                invert_match = options.invert_match
+                quiet = options.quiet
+                if invert_match:
+                    # Lines of blocks without matches are selected, not skipped
+                    numbered_lines = enumerate(self._file_reader.read_lines(file_path), 1)
+                else:
+                    numbered_lines = self._candidate_lines(file_path, options)
+                for line_number, line_content in numbered_lines:
+                    if has_any_match(line_content, options) != invert_match:
+                        # Record one placeholder match per selected line
+                        add(line_number, line_content if keep_content else '', 0, 0, pattern)
+                        if quiet:
+                            break
             else:
-                for line_number, line_content in enumerate(self._file_reader.read_lines(file_path), 1):
-                    line_matches = self._pattern_matcher.find_matches(line_content, line_number, options)
-                    
-                    # Apply invert match logic
-                    should_include = self._pattern_matcher.should_include_line(line_matches, options)
-                    
-                    if should_include:
-                        if options.invert_match:
-                            # For invert match, create a dummy match result
-                            matches.append(MatchResult(
-                                line_number=line_number,
-                                line_content=line_content,
-                                match_start=0,
-                                match_end=0,
-                                pattern=options.patterns[0] if options.patterns else None
-                            ))
-                        else:
-                            matches.extend(line_matches)
+                # Invert matching was handled above, so a line is included
+                # exactly when it has matches
+                find_matches = self._pattern_matcher.find_matches
+                for line_number, line_content in self._candidate_lines(file_path, options):
+                    line_matches = find_matches(line_content, line_number, options)
+                    if line_matches:
+                        matches.extend(line_matches)
         except (UnicodeDecodeError, IOError):
             # Handle files that can't be read as text
             pass
         
         return FileMatch(file_path=file_path, matches=matches, is_binary=is_binary)
     
+    def _candidate_lines(self, file_path: str, options: SearchOptions) -> Iterator[Tuple[int, str]]:
+        """Yield numbered lines of a file, skipping blocks in which no line can match.
+        
+        Each block of text is searched once as a whole, so files where
+        matches are rare are not matched line by line; a skipped block is
+        only counted, never split.
+        """
+        may_match_block = self._pattern_matcher.may_match_block
+        line_number = 1
+        for block in self._file_reader.read_text_blocks(file_path):
+            if may_match_block(block, options):
+                lines = block.split('\n')
+                yield from enumerate(lines, line_number)
+                line_number += len(lines)
+            else:
+                line_number += block.count('\n') + 1
+    
     def _search_with_context(self, all_lines: List[str], options: SearchOptions) -> List[MatchResult]:
         """Search through lines and include context lines."""
         matches = []
         matching_line_numbers = set()
         
         # First pass: find all matching lines
-        for line_number, line_content in enumerate(all_lines, 1):
-            line_matches = self._pattern_matcher.find_matches(line_content, line_number, options)
-            should_include = self._pattern_matcher.should_include_line(line_matches, options)
-            
-            if should_include:
-                matching_line_numbers.add(line_number)
-                if options.invert_match:
-                    matches.append(MatchResult(
-                        line_number=line_number,
-                        line_content=line_content,
-                        match_start=0,
-                        match_end=0,
-                        pattern=options.patterns[0] if options.patterns else None
-                    ))
-                else:
+        if options.invert_match or not options.highlight_matches:
+            # No spans are highlighted; only presence needs checking
+            pattern = options.patterns[0] if options.patterns else None
+            has_any_match = self._pattern_matcher.has_any_match
+            invert_match = options.invert_match
+            for line_number, line_content in enumerate(all_lines, 1):
+                if has_any_match(line_content, options) != invert_match:
+                    matching_line_numbers.add(line_number)
+                    matches.append(MatchResult(line_number, line_content, 0, 0, pattern))
+        else:
+            find_matches = self._pattern_matcher.find_matches
+            for line_number, line_content in enumerate(all_lines, 1):
+                line_matches = find_matches(line_content, line_number, options)
+                if line_matches:
+                    matching_line_numbers.add(line_number)
                     matches.extend(line_matches)
         
         # Second pass: add context lines
@@ -228,18 +220,14 @@ class CountUseCase:
     
     def execute(self, file_paths: List[str], options: SearchOptions) -> SearchResult:
         """Execute count-only search."""
-        # Force count_only to True for this use case
-        count_options = SearchOptions(
-            patterns=options.patterns,
-            invert_match=options.invert_match,
+        # Force count_only to True for this use case. replace() keeps the
+        # same SearchPattern objects, so their compiled regexes are reused
+        count_options = replace(
+            options,
             count_only=True,
-            quiet=options.quiet,
             context_before=0,  # No context for count
             context_after=0,   # No context for count
-            highlight_matches=False,  # No highlighting for count
-            recursive=options.recursive,
-            ignore_binary=options.ignore_binary,
-            max_threads=options.max_threads
+            highlight_matches=False  # No highlighting for count
         )
         
         return self._search_usecase.execute(file_paths, count_options)
@@ -253,17 +241,13 @@ class QuietUseCase:
     
     def execute(self, file_paths: List[str], options: SearchOptions) -> bool:
         """Execute quiet search and return whether matches were found."""
-        quiet_options = SearchOptions(
-            patterns=options.patterns,
-            invert_match=options.invert_match,
+        quiet_options = replace(
+            options,
             count_only=False,
             quiet=True,
             context_before=0,
             context_after=0,
-            highlight_matches=False,
-            recursive=options.recursive,
-            ignore_binary=options.ignore_binary,
-            max_threads=options.max_threads
+            highlight_matches=False
         )
         
         result = self._search_usecase.execute(file_paths, quiet_options)
@@ -0,0 +1,54 @@
+"""Tests for the command-line argument parser."""
+
+import pytest
+
+from prep.cli.argument_parser import PrepArgumentParser
+from prep.domain.models import SearchOptions
+from prep.infrastructure.pattern_matching import HybridPatternMatcher
+
+re2 = pytest.importorskip("re2")
+
+
+def _parse_pattern(*args):
+    options, _ = PrepArgumentParser().parse_args([*args, "app.log"])
+    return options.patterns[0]
+
+
+class TestRe2Engine:
+    """Test which patterns --engine re2 compiles with re2."""
+
+    def test_plain_regex_uses_re2(self):
+        """Test that a regex without Boolean operators is compiled by re2."""
+        pattern = _parse_pattern("--engine", "re2", "-r", r"err(or)?[0-9]+")
+        assert pattern.engine == "re2"
+        assert type(pattern.compiled) is type(re2.compile("x"))
+
+    def test_boolean_expressions_stay_on_stdlib(self):
+        """Test that expressions and backreferences keep the stdlib engine."""
+        for expression in ["error | foo", "a|b", "a&b", "!a", "  ", r"(a)\1"]:
+            assert _parse_pattern("--engine", "re2", "-r", expression).engine == "re", expression
+
+    def test_syntax_re2_lacks_falls_back_to_stdlib(self):
+        """Test that lookarounds and similar stdlib-only syntax are not rejected."""
+        for expression in [r"a(?=b)", r"(?<=a)b", r"a++", r"(?>a)", r"a\Z", r"(?P<n>a)(?P=n)"]:
+            pattern = _parse_pattern("--engine", "re2", "-r", expression)
+            assert pattern.engine == "re", expression
+            assert pattern.compiled is not None, expression
+
+    def test_ascii_only_classes_stay_on_stdlib(self):
+        """Test that classes re2 limits to ASCII, and -w, keep the stdlib engine."""
+        for args in [["-w", "-r", "caf"], ["-r", r"\w+ve"], ["-r", r"\d"], ["-r", r"a\sb"], ["-r", r"caf\b"]]:
+            assert _parse_pattern("--engine", "re2", *args).engine == "re", args
+
+    def test_matches_agree_with_default_engine(self):
+        """Test that choosing re2 does not change which lines match."""
+        lines = ["error here", "foo bar", "errorfoo", "error 42", "nothing", "ERROR5",
+                 "café", "naïve", "\u0663", "a\u2003b", "ÉRROR"]
+        for args in [["-r", "error | foo"], ["-r", r"error \d+"], ["-i", "-r", "error"], ["-w", "-r", "foo"],
+                     ["-w", "-r", "caf"], ["-r", r"\w+ve"], ["-r", r"\d"], ["-r", r"a\sb"], ["-i", "-r", "érror"],
+                     ["-r", "caf."]]:
+            default = SearchOptions(patterns=[_parse_pattern(*args)])
+            with_re2 = SearchOptions(patterns=[_parse_pattern("--engine", "re2", *args)])
+            for line in lines:
+                assert HybridPatternMatcher().has_any_match(line, with_re2) == \
+                    HybridPatternMatcher().has_any_match(line, default), (args, line)
@@ -0,0 +1,132 @@
+"""Tests for the Boolean expression parser."""
+
+import itertools
+import pickle
+import re
+
+from prep.infrastructure.boolean_parser import (
+    CompiledExpression, OP_JUMP_IF_FALSE_OR_POP, OP_MATCH,
+    extract_required_literal, parse_boolean_pattern
+)
+
+
+class TestEvaluationOrder:
+    """Test selectivity-based ordering of AND/OR children."""
+
+    def test_and_evaluates_rarer_literal_first(self):
+        """Test that AND tries the longer, more selective literal first."""
+        tree = parse_boolean_pattern("e&timeout")
+
+        assert tree.ordered == (tree.right, tree.left)
+        assert tree.get_patterns() == ["e", "timeout"]
+
+    def test_or_evaluates_likelier_literal_first(self):
+        """Test that OR tries the literal most likely to match first."""
+        tree = parse_boolean_pattern("database|db")
+
+        assert tree.ordered == (tree.right, tree.left)
+
+    def test_reordering_keeps_results(self):
+        """Test that evaluation results do not depend on the order."""
+        tree = parse_boolean_pattern("error&!(debug|trace)")
+
+        assert tree.evaluate("error: disk full")
+        assert not tree.evaluate("error in debug mode")
+        assert not tree.evaluate("all good")
+
+
+class TestParsing:
+    """Test how expressions are split into operators and literals."""
+
+    def test_parenthesized_operands(self):
+        """Test that separately parenthesized operands are not merged."""
+        tree = parse_boolean_pattern("(a)&(b c)")
+
+        assert tree.get_patterns() == ["a", "b c"]
+        assert tree.evaluate("a b c") and not tree.evaluate("a")
+
+    def test_incomplete_expression_is_literal(self):
+        """Test that a dangling operator falls back to a plain literal."""
+        assert parse_boolean_pattern("a&").get_patterns() == ["a&"]
+
+
+class TestCompiledExpression:
+    """Test the flattened form of expression trees."""
+
+    EXPRESSIONS = ["a", "a&b", "a|b", "!a", "a&!(b|c)", "(a|b)&(c|!a)", "!(a&b)|c&a"]
+
+    def test_matches_tree_evaluation(self):
+        """Test that compiled expressions agree with the tree on all inputs."""
+        for expression in self.EXPRESSIONS:
+            tree = parse_boolean_pattern(expression)
+            compiled = CompiledExpression(tree)
+            for bits in itertools.product([False, True], repeat=3):
+                text = "".join(ch for ch, present in zip("abc", bits) if present)
+                assert compiled.evaluate(text) == tree.evaluate(text), (expression, text)
+                assert compiled._run_ops(text) == tree.evaluate(text), (expression, text)
+
+    def test_ops_use_jumps_for_short_circuit(self):
+        """Test that AND/OR compile to conditional jumps over the second operand."""
+        compiled = CompiledExpression(parse_boolean_pattern("a&b"))
+
+        assert compiled.ops == [(OP_MATCH, 0), (OP_JUMP_IF_FALSE_OR_POP, 2), (OP_MATCH, 1)]
+        assert compiled.literals == ["a", "b"]
+
+    def test_repeated_literal_searched_once(self):
+        """Test that a literal used twice shares one node and one search."""
+        tree = parse_boolean_pattern(r"(e\w+&w)|(e\w+&t)")
+        assert tree.left.left is tree.right.left
+
+        compiled = CompiledExpression(tree)
+        calls = []
+        search = compiled.evaluate.__globals__["s0"]
+        compiled.evaluate.__globals__["s0"] = lambda text: calls.append(text) or search(text)
+
+        assert compiled.evaluate("ex t w") and calls == ["ex t w"]
+        assert not compiled.evaluate("ex") and len(calls) == 2
+
+    def test_failed_and_operand_skips_the_other_search(self):
+        """Test that leaves are searched lazily, not all up front."""
+        compiled = CompiledExpression(parse_boolean_pattern(r"e\w+&w\d"))
+        calls = []
+        search = compiled.evaluate.__globals__["s1"]
+        compiled.evaluate.__globals__["s1"] = lambda text: calls.append(text) or search(text)
+
+        assert not compiled.evaluate("w1 only")
+        assert calls == []
+        assert compiled.evaluate("ex w1") and calls == ["ex w1"]
+
+    def test_deep_nesting_falls_back_to_interpreter(self):
+        """Test that expressions too deep for the compiler still evaluate."""
+        compiled = CompiledExpression(parse_boolean_pattern("!" * 300 + "a"))
+
+        assert compiled.evaluate("a")
+        assert not compiled.evaluate("b")
+
+    def test_pickle_round_trip(self):
+        """Test that compiled expressions survive pickling for worker processes."""
+        compiled = pickle.loads(pickle.dumps(CompiledExpression(parse_boolean_pattern("a&!b"))))
+
+        assert compiled.evaluate("a")
+        assert not compiled.evaluate("ab")
+
+
+class TestRequiredLiteral:
+    """Test extraction of literal prefilter hints from regexes."""
+
+    def test_longest_top_level_run(self):
+        """Test that optional and repeated parts are not part of the hint."""
+        assert extract_required_literal("colou?r") == ("colo", False)
+        assert extract_required_literal(r"\d+ms timeout") == ("ms timeout", False)
+        assert extract_required_literal("x(abc)*y") == ("x", False)
+
+    def test_plain_literal_is_exact(self):
+        """Test that escaped metacharacters still form an exact literal."""
+        assert extract_required_literal(r"\.log") == (".log", True)
+
+    def test_no_hint_when_unsafe(self):
+        """Test that alternations, case folding and bad regexes give no hint."""
+        assert extract_required_literal("a|b") == (None, False)
+        assert extract_required_literal("foo", re.IGNORECASE) == (None, False)
+        assert extract_required_literal("(?i)foo") == (None, False)
+        assert extract_required_literal("(unclosed") == (None, False)
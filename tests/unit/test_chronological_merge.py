@@ -0,0 +1,69 @@
+"""Tests for chronological merging of multi-file results."""
+
+from datetime import datetime
+
+from prep.domain.models import FileMatch, MatchResult, SearchResult
+from prep.infrastructure.chronological_merge import TimestampParser, merge_chronologically
+
+
+def _file_match(path, seconds):
+    matches = [
+        MatchResult(line_number, f"2024-01-15 10:30:{second:02d} event", 0, 5, None)
+        for line_number, second in enumerate(seconds, 1)
+    ]
+    return FileMatch(path, matches)
+
+
+class TestTimestampParser:
+    """Test TimestampParser behavior."""
+
+    def test_leading_timestamp(self):
+        """Test timestamps at the start of a line, with and without fractions."""
+        assert TimestampParser.parse_timestamp("2024-01-15 10:30:45 INFO") == datetime(2024, 1, 15, 10, 30, 45)
+        assert TimestampParser.parse_timestamp("2024-01-15T10:30:45.123Z up") == datetime(2024, 1, 15, 10, 30, 45)
+
+    def test_embedded_timestamp(self):
+        """Test timestamps found later in the line."""
+        assert TimestampParser.parse_timestamp("[app] 2024-01-15 10:30:45 ok") == datetime(2024, 1, 15, 10, 30, 45)
+
+    def test_invalid_timestamps(self):
+        """Test that malformed or impossible timestamps are rejected."""
+        assert TimestampParser.parse_timestamp("2024-13-15 10:30:45") is None
+        assert TimestampParser.parse_timestamp("2024-01-15 1a:30:45") is None
+        assert TimestampParser.parse_timestamp("no timestamp here") is None
+    
+    def test_bulk_leading_timestamps(self):
+        """Test that bulk parsing agrees with per-line parsing or declines."""
+        lines = ["2024-01-15 10:30:45 a", "2024-01-15T10:30:46.5 b"]
+        assert TimestampParser.parse_leading_timestamps(lines) == [
+            TimestampParser.parse_timestamp(line) for line in lines
+        ]
+        assert TimestampParser.parse_leading_timestamps(lines + ["[app] 2024-01-15 10:30:47"]) is None
+        assert TimestampParser.parse_leading_timestamps(["2024-13-15 10:30:45"]) is None
+
+
+class TestChronologicalMerger:
+    """Test ChronologicalMerger behavior."""
+
+    def test_interleaves_files_by_timestamp(self):
+        """Test that matches from several files are merged in time order."""
+        result = SearchResult([_file_match("a.log", [1, 4]), _file_match("b.log", [2, 3])], 4, 2)
+
+        merged = merge_chronologically(result)
+        assert [fm.file_path for fm in merged.file_matches] == ["a.log", "b.log", "a.log"]
+        assert [len(fm.matches) for fm in merged.file_matches] == [1, 2, 1]
+
+    def test_unordered_file_is_sorted(self):
+        """Test that a file whose own lines are out of order is still merged correctly."""
+        result = SearchResult([_file_match("a.log", [5, 1]), _file_match("b.log", [3])], 3, 2)
+
+        merged = merge_chronologically(result)
+        seconds = [m.line_content[17:19] for fm in merged.file_matches for m in fm.matches]
+        assert seconds == ["01", "03", "05"]
+
+    def test_missing_timestamp_keeps_original(self):
+        """Test that one untimestamped match leaves the result unchanged."""
+        plain = FileMatch("c.log", [MatchResult(1, "no time", 0, 2, None)])
+        result = SearchResult([_file_match("a.log", [1]), plain], 2, 2)
+
+        assert merge_chronologically(result) is result
@@ -1,23 +1,63 @@
 """Unit tests for context functionality (-A, -B, -C options)."""
 
 import unittest
+from types import SimpleNamespace
 from unittest.mock import Mock
-from typing import List
 
 from prep.usecases.search_usecase import SearchUseCase
 from prep.infrastructure.output_formatting import StandardOutputFormatter
 from prep.domain.models import SearchOptions, SearchPattern, MatchType, MatchResult, FileMatch
 
 
+# Lines of the test.log fixture, shared read-only by every test
+_TEST_LINES = ("affe", "baer", "hund", "chimpanzee", "bird", "dinosaur", "turtle")
+
+# The formatter keeps no state, so one instance serves every test
+_FORMATTER = StandardOutputFormatter()
+
+
+def _make_line_matcher(target_line: str):
+    """Build a find_matches stand-in that matches one exact line."""
+    def find_matches(line_content, line_number, options):
+        if line_content == target_line:
+            return [MatchResult(line_number, line_content, 0, len(line_content), options.patterns[0])]
+        return []
+    return find_matches
+
+
+def _match_signature(matches):
+    """Summarize matches as (line number, is real match) pairs; context lines start at -1."""
+    return {(m.line_number, m.match_start != -1) for m in matches}
+
+
 class TestContextFunctionality(unittest.TestCase):
     """Test context functionality for before, after, and around options."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Build the immutable pattern and -A/-B/-C options shared by the tests."""
+        cls._pattern = SearchPattern("chimpanzee", MatchType.NORMAL)
+        cls._opts_A2 = SearchOptions(patterns=[cls._pattern], context_before=0, context_after=2, highlight_matches=True)
+        cls._opts_B2 = SearchOptions(patterns=[cls._pattern], context_before=2, context_after=0, highlight_matches=True)
+        cls._opts_C1 = SearchOptions(patterns=[cls._pattern], context_before=1, context_after=1, highlight_matches=True)
+
     def setUp(self):
         """Set up test fixtures."""
-        self.file_reader = Mock()
-        self.file_scanner = Mock()
-        self.pattern_matcher = Mock()
-        self.parallel_executor = Mock()
+        # Mock file content matching the test.log; the use case only iterates it
+        self.test_lines = _TEST_LINES
+        
+        # Plain namespaces: collaborator methods are bare functions, and a
+        # method the use case calls but a test did not provide fails loudly
+        self.file_reader = SimpleNamespace(
+            exists=lambda file_path: True,
+            is_binary=lambda file_path: False,
+            read_lines=lambda file_path: self.test_lines
+        )
+        self.file_scanner = SimpleNamespace()
+        self.pattern_matcher = SimpleNamespace(
+            should_include_line=lambda line_matches, options: bool(line_matches)
+        )
+        self.parallel_executor = SimpleNamespace()
         
         self.search_usecase = SearchUseCase(
             file_reader=self.file_reader,
@@ -26,161 +66,31 @@ class TestContextFunctionality(unittest.TestCase):
             parallel_executor=self.parallel_executor
         )
         
-        self.output_formatter = StandardOutputFormatter()
+    def test_context_matrix(self):
+        """Test -A 2, -B 2 and -C 1 around the "chimpanzee" match on line 4."""
+        # Setup stubs once; they carry no state between searches
+        self.pattern_matcher.find_matches = _make_line_matcher("chimpanzee")
         
-        # Mock file content matching the test.log
-        self.test_lines = [
-            "affe",
-            "baer", 
-            "hund",
-            "chimpanzee",
-            "bird",
-            "dinosaur",
-            "turtle"
+        cases = [
+            ("A2", self._opts_A2, {(4, True), (5, False), (6, False)}),  # 1 match + 2 after context
+            ("B2", self._opts_B2, {(2, False), (3, False), (4, True)}),  # 2 before context + 1 match
+            ("C1", self._opts_C1, {(3, False), (4, True), (5, False)}),  # 1 before + 1 match + 1 after
         ]
-        
-    def test_context_after_A2(self):
-        """Test -A 2 option (2 lines after match)."""
-        # Setup mocks
-        self.file_reader.exists.return_value = True
-        self.file_reader.is_binary.return_value = False
-        self.file_reader.read_lines.return_value = self.test_lines
-        
-        # Mock pattern matcher to find "chimpanzee" on line 4
-        def mock_find_matches(line_content, line_number, options):
-            if line_content == "chimpanzee":
-                pattern = options.patterns[0] if options.patterns else None
-                return [MatchResult(line_number, line_content, 0, len(line_content), pattern)]
-            return []
-        
-        def mock_should_include_line(line_matches, options):
-            return len(line_matches) > 0
-        
-        self.pattern_matcher.find_matches.side_effect = mock_find_matches
-        self.pattern_matcher.should_include_line.side_effect = mock_should_include_line
-        
-        # Create search options for -A 2
-        pattern = SearchPattern("chimpanzee", MatchType.NORMAL)
-        options = SearchOptions(
-            patterns=[pattern],
-            context_before=0,
-            context_after=2,
-            highlight_matches=True
-        )
-        
-        # Execute search
-        result = self.search_usecase._search_single_file("test.log", options)
-        
-        # Verify results
-        self.assertEqual(len(result.matches), 3)  # 1 match + 2 after context
-        
-        # Check line numbers and content
-        matches_by_line = {m.line_number: m for m in result.matches}
-        self.assertIn(4, matches_by_line)  # Match line
-        self.assertIn(5, matches_by_line)  # After context 1
-        self.assertIn(6, matches_by_line)  # After context 2
-        
-        # Check match vs context distinction
-        self.assertNotEqual(matches_by_line[4].match_start, -1)  # Real match
-        self.assertEqual(matches_by_line[5].match_start, -1)     # Context line
-        self.assertEqual(matches_by_line[6].match_start, -1)     # Context line
-        
-    def test_context_before_B2(self):
-        """Test -B 2 option (2 lines before match)."""
-        # Setup mocks
-        self.file_reader.exists.return_value = True
-        self.file_reader.is_binary.return_value = False
-        self.file_reader.read_lines.return_value = self.test_lines
-        
-        # Mock pattern matcher
-        def mock_find_matches(line_content, line_number, options):
-            if line_content == "chimpanzee":
-                pattern = options.patterns[0] if options.patterns else None
-                return [MatchResult(line_number, line_content, 0, len(line_content), pattern)]
-            return []
-        
-        def mock_should_include_line(line_matches, options):
-            return len(line_matches) > 0
-        
-        self.pattern_matcher.find_matches.side_effect = mock_find_matches
-        self.pattern_matcher.should_include_line.side_effect = mock_should_include_line
-        
-        # Create search options for -B 2
-        pattern = SearchPattern("chimpanzee", MatchType.NORMAL)
-        options = SearchOptions(
-            patterns=[pattern],
-            context_before=2,
-            context_after=0,
-            highlight_matches=True
-        )
-        
-        # Execute search
-        result = self.search_usecase._search_single_file("test.log", options)
-        
-        # Verify results
-        self.assertEqual(len(result.matches), 3)  # 2 before context + 1 match
-        
-        # Check line numbers and content
-        matches_by_line = {m.line_number: m for m in result.matches}
-        self.assertIn(2, matches_by_line)  # Before context 1
-        self.assertIn(3, matches_by_line)  # Before context 2
-        self.assertIn(4, matches_by_line)  # Match line
-        
-        # Check match vs context distinction
-        self.assertEqual(matches_by_line[2].match_start, -1)     # Context line
-        self.assertEqual(matches_by_line[3].match_start, -1)     # Context line
-        self.assertNotEqual(matches_by_line[4].match_start, -1)  # Real match
-        
-    def test_context_around_C1(self):
-        """Test -C 1 option (1 line before and after match)."""
-        # Setup mocks
-        self.file_reader.exists.return_value = True
-        self.file_reader.is_binary.return_value = False
-        self.file_reader.read_lines.return_value = self.test_lines
-        
-        # Mock pattern matcher
-        def mock_find_matches(line_content, line_number, options):
-            if line_content == "chimpanzee":
-                pattern = options.patterns[0] if options.patterns else None
-                return [MatchResult(line_number, line_content, 0, len(line_content), pattern)]
-            return []
-        
-        def mock_should_include_line(line_matches, options):
-            return len(line_matches) > 0
-        
-        self.pattern_matcher.find_matches.side_effect = mock_find_matches
-        self.pattern_matcher.should_include_line.side_effect = mock_should_include_line
-        
-        # Create search options for -C 1
-        pattern = SearchPattern("chimpanzee", MatchType.NORMAL)
-        options = SearchOptions(
-            patterns=[pattern],
-            context_before=1,
-            context_after=1,
-            highlight_matches=True
-        )
-        
-        # Execute search
-        result = self.search_usecase._search_single_file("test.log", options)
-        
-        # Verify results
-        self.assertEqual(len(result.matches), 3)  # 1 before + 1 match + 1 after
-        
-        # Check line numbers and content
-        matches_by_line = {m.line_number: m for m in result.matches}
-        self.assertIn(3, matches_by_line)  # Before context
-        self.assertIn(4, matches_by_line)  # Match line
-        self.assertIn(5, matches_by_line)  # After context
-        
-        # Verify content
-        self.assertEqual(matches_by_line[3].line_content, "hund")
-        self.assertEqual(matches_by_line[4].line_content, "chimpanzee")
-        self.assertEqual(matches_by_line[5].line_content, "bird")
+        for case, options, expected in cases:
+            with self.subTest(case=case):
+                result = self.search_usecase._search_single_file("test.log", options)
+                
+                self.assertEqual(len(result.matches), 3)
+                self.assertEqual(_match_signature(result.matches), expected)
+                
+                # Every line, match or context, carries its own text
+                for match in result.matches:
+                    self.assertEqual(match.line_content, _TEST_LINES[match.line_number - 1])
         
     def test_output_formatting_with_context(self):
         """Test that context lines are formatted differently from match lines."""
         # Create mock file match with context
-        pattern = SearchPattern("chimpanzee", MatchType.NORMAL)
+        pattern = self._pattern
         
         matches = [
             MatchResult(3, "hund", -1, -1, None),  # Context line
@@ -198,42 +108,19 @@ class TestContextFunctionality(unittest.TestCase):
         )
         
         # Format output
-        result = self.output_formatter.format_file_match(file_match, options)
+        result = _FORMATTER.format_file_match(file_match, options)
         
-        # Verify formatting
-        lines = result.split('\n')
-        self.assertEqual(len(lines), 3)
-        
-        # Context lines should have '-' separator
-        self.assertTrue(lines[0].startswith("3-"))
-        self.assertTrue("hund" in lines[0])
-        
-        # Match line should have ':' separator
-        self.assertTrue(lines[1].startswith("4:"))
-        self.assertTrue("chimpanzee" in lines[1])
-        
-        # Context lines should have '-' separator
-        self.assertTrue(lines[2].startswith("5-"))
-        self.assertTrue("bird" in lines[2])
+        # Context lines use a '-' separator, the match line ':'; no
+        # trailing newline or stray separator is allowed
+        self.assertEqual(tuple(result.splitlines()), ("3-hund", "4:chimpanzee", "5-bird"))
+        self.assertFalse(result.endswith('\n'))
         
     def test_context_at_file_boundaries(self):
         """Test context handling at file start and end."""
         # Test context at beginning of file
-        self.file_reader.exists.return_value = True
-        self.file_reader.is_binary.return_value = False
-        self.file_reader.read_lines.return_value = ["match", "line2", "line3"]
-        
-        def mock_find_matches(line_content, line_number, options):
-            if line_content == "match":
-                pattern = options.patterns[0] if options.patterns else None
-                return [MatchResult(line_number, line_content, 0, len(line_content), pattern)]
-            return []
+        self.test_lines = ["match", "line2", "line3"]
         
-        def mock_should_include_line(line_matches, options):
-            return len(line_matches) > 0
-        
-        self.pattern_matcher.find_matches.side_effect = mock_find_matches
-        self.pattern_matcher.should_include_line.side_effect = mock_should_include_line
+        self.pattern_matcher.find_matches = _make_line_matcher("match")
         
         pattern = SearchPattern("match", MatchType.NORMAL)
         options = SearchOptions(
@@ -247,10 +134,25 @@ class TestContextFunctionality(unittest.TestCase):
         
         # Should have match + 1 after context (no before context available)
         self.assertEqual(len(result.matches), 2)
-        line_numbers = [m.line_number for m in result.matches]
-        self.assertIn(1, line_numbers)  # Match
-        self.assertIn(2, line_numbers)  # After context
-        self.assertNotIn(0, line_numbers)  # No line 0
+        self.assertEqual(_match_signature(result.matches), {(1, True), (2, False)})  # No line 0
+    
+    def test_context_without_highlighting_skips_spans(self):
+        """Test that unhighlighted context output only asks whether lines match."""
+        # find_matches stays a Mock: this test asserts it is never called
+        self.pattern_matcher.find_matches = Mock()
+        self.pattern_matcher.has_any_match = lambda line, options: line == "hund"
+        
+        options = SearchOptions(
+            patterns=[SearchPattern("hund", MatchType.NORMAL)],
+            context_after=1,
+            highlight_matches=False
+        )
+        
+        result = self.search_usecase._search_single_file("test.log", options)
+        
+        self.pattern_matcher.find_matches.assert_not_called()
+        self.assertEqual([m.line_number for m in result.matches], [3, 4])
+        self.assertEqual(result.matches[1].match_start, -1)  # Context line
         
 
 if __name__ == '__main__':
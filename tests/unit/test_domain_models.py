@@ -1,9 +1,12 @@
 """Tests for domain models."""
 
+import pickle
 import re
 
+import pytest
+
 from prep.domain.models import (
-    SearchPattern, MatchResult, FileMatch, SearchOptions, SearchResult,
+    SearchPattern, MatchResult, MatchTable, FileMatch, SearchOptions, SearchResult,
     MatchType, RegexFlag
 )
 
@@ -56,6 +59,52 @@ class TestSearchPattern:
         assert compiled.search("test.*") is not None
         assert compiled.search("testing") is None
 
+    def test_precompiled_pattern_is_reused(self):
+        """Test that a stashed compiled regex is returned as-is."""
+        precompiled = re.compile("te+st")
+        pattern = SearchPattern("te+st", compiled=precompiled)
+
+        assert pattern.compile() is precompiled
+        assert pattern == SearchPattern("te+st")
+
+    def test_compile_is_memoized_on_instance(self):
+        """Test that the first compile() stashes the regex on the pattern."""
+        pattern = SearchPattern("memo", match_type=MatchType.WORD)
+        compiled = pattern.compile()
+
+        assert pattern.compiled is compiled
+        assert pattern.compile() is compiled
+        assert pattern == SearchPattern("memo", match_type=MatchType.WORD)
+
+    def test_compile_is_cached(self):
+        """Test that equal patterns share one compiled regex."""
+        assert SearchPattern("cache").compile() is SearchPattern("cache").compile()
+
+    def test_pickle_drops_compiled_regex(self):
+        """Test that pickled patterns are rebuilt without the compiled regex."""
+        pattern = SearchPattern("te+st", regex_flags=re.IGNORECASE)
+        pattern = SearchPattern("te+st", regex_flags=re.IGNORECASE, compiled=pattern.compile())
+
+        restored = pickle.loads(pickle.dumps(pattern))
+        assert restored == pattern
+        assert restored.compiled is None
+        assert restored.compile().search("TEEST") is not None
+
+    def test_pickle_keeps_engine(self):
+        """Test that worker processes recompile a pattern with the engine it was built for."""
+        restored = pickle.loads(pickle.dumps(SearchPattern("a b", engine="re2")))
+        assert restored.engine == "re2"
+
+    def test_re2_engine_compiles_with_re2(self):
+        """Test that the re2 engine applies match type and flags."""
+        re2 = pytest.importorskip("re2")
+        pattern = SearchPattern("TE+ST", match_type=MatchType.WORD, regex_flags=re.IGNORECASE, engine="re2")
+
+        compiled = pickle.loads(pickle.dumps(pattern)).compile()
+        assert type(compiled) is type(re2.compile("x"))
+        assert compiled.search("a teest b") is not None
+        assert compiled.search("teests") is None
+
 
 class TestMatchResult:
     """Test MatchResult behavior."""
@@ -76,6 +125,13 @@ class TestMatchResult:
         assert match.match_start == 10
         assert match.match_end == 14
         assert match.pattern == pattern
+    
+    def test_match_result_has_no_instance_dict(self):
+        """Test that matches are slotted and still pickle."""
+        match = MatchResult(1, "abc", 0, 1, None)
+        
+        assert not hasattr(match, "__dict__")
+        assert pickle.loads(pickle.dumps(match)) == match
 
 
 class TestFileMatch:
@@ -104,6 +160,43 @@ class TestFileMatch:
         assert file_match.match_count == 0
 
 
+class TestMatchTable:
+    """Test column-wise match storage."""
+
+    def test_round_trips_matches(self):
+        """Test that stored matches come back as equal MatchResults."""
+        pattern = SearchPattern("test")
+        matches = [
+            MatchResult(1, "test line", 0, 4, pattern),
+            MatchResult(2, "another test", 8, 12, pattern)
+        ]
+
+        table = MatchTable(matches)
+        assert len(table) == 2
+        assert table[1] == matches[1]
+        assert list(table) == matches
+        assert table == matches
+        assert FileMatch("test.txt", table).match_count == 2
+
+    def test_pickle_keeps_pattern_interning(self):
+        """Test that a table can be extended after a pickle round trip."""
+        table = pickle.loads(pickle.dumps(MatchTable([MatchResult(1, "a", 0, 1, SearchPattern("a"))])))
+        other = SearchPattern("b")
+        table.add(2, "b", 0, 1, other)
+
+        assert table[0].pattern == SearchPattern("a")
+        assert table[1].pattern is other
+
+    def test_empty_table_pickles_small(self):
+        """Test that an empty table pickles without its columns and stays usable."""
+        data = pickle.dumps(MatchTable())
+        assert b"array" not in data
+
+        table = pickle.loads(data)
+        table.add(1, "a", 0, 1, None)
+        assert len(table) == 1
+
+
 class TestSearchOptions:
     """Test SearchOptions behavior."""
     
@@ -0,0 +1,138 @@
+"""Tests for file operation implementations."""
+
+import os
+import tempfile
+from pathlib import Path
+
+from prep.infrastructure.file_operations import MmapFileReader, StandardFileReader, StandardFileScanner
+
+
+class TestStandardFileReader:
+    """Test StandardFileReader behavior."""
+
+    def setup_method(self):
+        """Create a temporary directory for test files."""
+        self.temp_dir = tempfile.mkdtemp()
+
+    def teardown_method(self):
+        """Clean up test files."""
+        import shutil
+        shutil.rmtree(self.temp_dir)
+
+    def test_lines_spanning_chunks(self):
+        """Test that lines and multi-byte characters survive chunk boundaries."""
+        path = Path(self.temp_dir) / "chunks.txt"
+        lines = [f"line {i} caf\u00e9 \u65e5\u672c" for i in range(50)]
+        path.write_bytes("\r\n".join(lines).encode("utf-8"))
+
+        reader = StandardFileReader()
+        reader.READ_CHUNK_SIZE = 7
+        assert list(reader.read_lines(str(path))) == lines
+
+    def test_text_blocks_hold_whole_lines(self):
+        """Test that blocks split into the lines read_lines yields, without carriage returns."""
+        path = Path(self.temp_dir) / "blocks.txt"
+        path.write_bytes(b"one\r\ntwo\n\nthree\r")
+
+        reader = StandardFileReader()
+        reader.READ_CHUNK_SIZE = 5
+        blocks = list(reader.read_text_blocks(str(path)))
+        assert all('\r' not in block for block in blocks)
+        assert [line for block in blocks for line in block.split('\n')] == ["one", "two", "", "three"]
+
+
+class TestMmapFileReader:
+    """Test MmapFileReader behavior."""
+
+    def setup_method(self):
+        """Create a temporary directory for test files."""
+        self.temp_dir = tempfile.mkdtemp()
+
+    def teardown_method(self):
+        """Clean up test files."""
+        import shutil
+        shutil.rmtree(self.temp_dir)
+
+    def _write(self, name: str, data: bytes) -> str:
+        path = Path(self.temp_dir) / name
+        path.write_bytes(data)
+        return str(path)
+
+    def test_mapped_lines_match_standard_reader(self):
+        """Test that mapped reading yields the same lines as buffered reading."""
+        file_path = self._write("log.txt", b"first\nsecond\r\n\nlast without newline")
+
+        mapped = list(MmapFileReader(mmap_threshold=0).read_lines(file_path))
+        standard = list(StandardFileReader().read_lines(file_path))
+
+        assert mapped == ["first", "second", "", "last without newline"]
+        assert mapped == standard
+
+    def test_mapped_windows_split_only_at_newlines(self):
+        """Test windowed decoding with lines longer than the window."""
+        lines = ["short", "x" * 40, "caf\u00e9", "", "tail"]
+        file_path = self._write("windows.txt", "\n".join(lines).encode("utf-8"))
+
+        reader = MmapFileReader(mmap_threshold=0)
+        reader.READ_CHUNK_SIZE = 8
+        assert list(reader.read_lines(file_path)) == lines
+
+    def test_small_file_uses_standard_reader(self):
+        """Test that files below the threshold are still read correctly."""
+        file_path = self._write("small.txt", b"one\ntwo\n")
+
+        assert list(MmapFileReader().read_lines(file_path)) == ["one", "two"]
+
+    def test_invalid_utf8_is_replaced(self):
+        """Test that undecodable bytes do not abort reading."""
+        file_path = self._write("latin1.txt", b"caf\xe9\nok\n")
+
+        lines = list(MmapFileReader(mmap_threshold=0).read_lines(file_path))
+        assert lines == ["caf�", "ok"]
+
+    def test_missing_file_yields_nothing(self):
+        """Test that a missing file produces no lines."""
+        missing = str(Path(self.temp_dir) / "missing.txt")
+
+        assert list(MmapFileReader(mmap_threshold=0).read_lines(missing)) == []
+
+    def test_binary_probe_on_mapped_file(self):
+        """Test NUL-byte detection in the probe window of a mapped file."""
+        reader = MmapFileReader(mmap_threshold=0)
+        binary_path = self._write("data.dat", b"header\x00" + b"x" * 20000)
+        text_path = self._write("text.dat", b"plain text\n" * 2000)
+
+        assert reader.is_binary(binary_path)
+        assert not reader.is_binary(text_path)
+
+
+class TestStandardFileScanner:
+    """Test StandardFileScanner behavior."""
+
+    def setup_method(self):
+        """Create a small directory tree."""
+        self.temp_dir = tempfile.mkdtemp()
+        root = Path(self.temp_dir)
+        (root / "sub" / "deeper").mkdir(parents=True)
+        (root / "top.txt").write_text("top")
+        (root / "sub" / "mid.txt").write_text("mid")
+        (root / "sub" / "deeper" / "low.txt").write_text("low")
+        os.symlink(root / "sub", root / "link_to_sub")
+
+    def teardown_method(self):
+        """Clean up test files."""
+        import shutil
+        shutil.rmtree(self.temp_dir)
+
+    def test_recursive_scan_finds_nested_files(self):
+        """Test that recursion finds all files without following directory symlinks."""
+        found = list(StandardFileScanner().scan_files([self.temp_dir], recursive=True))
+
+        relative = sorted(os.path.relpath(path, self.temp_dir) for path in found)
+        assert relative == [os.path.join("sub", "deeper", "low.txt"), os.path.join("sub", "mid.txt"), "top.txt"]
+
+    def test_non_recursive_scan_lists_direct_files(self):
+        """Test that a directory without recursion yields only its own files."""
+        found = list(StandardFileScanner().scan_files([self.temp_dir]))
+
+        assert found == [os.path.join(self.temp_dir, "top.txt")]
@@ -0,0 +1,78 @@
+"""Tests for the file watching use case."""
+
+import signal
+
+from prep.domain.interfaces import FileWatcher
+from prep.domain.models import SearchOptions, SearchPattern
+from prep.infrastructure.output_formatting import StandardOutputFormatter
+from prep.infrastructure.pattern_matching import HybridPatternMatcher
+from prep.usecases.file_watch_usecase import FileWatchUseCase
+
+
+class _ListWatcher(FileWatcher):
+    """Watcher that replays fixed batches of lines."""
+
+    def __init__(self, *batches):
+        self.batches = batches
+
+    def watch_file(self, file_path):
+        for batch in self.batches:
+            yield from batch
+
+    def watch_file_batches(self, file_path):
+        yield from self.batches
+
+    def stop_watching(self):
+        pass
+
+
+class TestFileWatchUseCase:
+    """Test FileWatchUseCase behavior."""
+
+    def _watch(self, watcher, **options):
+        usecase = FileWatchUseCase(watcher, HybridPatternMatcher(), StandardOutputFormatter())
+        return usecase.watch_and_search("watched.log", SearchOptions(patterns=[SearchPattern("err")], **options))
+
+    def test_prints_matching_lines_with_context(self, capsys):
+        """Test that matches and their after-context are written in order."""
+        watcher = _ListWatcher(["ok", "err one", "after"], ["no", "err two"])
+
+        assert self._watch(watcher, context_after=1) == 0
+        assert capsys.readouterr().out == "err one\nafter\nerr two\n"
+
+    def test_before_context(self, capsys):
+        """Test that lines seen before a match are printed ahead of it."""
+        watcher = _ListWatcher(["one", "two"], ["err"])
+
+        assert self._watch(watcher, context_before=1) == 0
+        assert capsys.readouterr().out == "two\nerr\n"
+
+    def test_highlighted_match_buffered_plain(self, capsys):
+        """Test that a highlighted match is kept unhighlighted as later context."""
+        watcher = _ListWatcher(["err", "err"])
+
+        assert self._watch(watcher, context_before=1, highlight_matches=True) == 0
+        assert "\nerr\n" in capsys.readouterr().out
+
+    def test_quiet_only_reports_status(self, capsys):
+        """Test that quiet and inverted quiet watching print nothing."""
+        assert self._watch(_ListWatcher(["ok", "err"]), quiet=True) == 0
+        assert self._watch(_ListWatcher(["err"]), quiet=True, invert_match=True) == 1
+        assert capsys.readouterr().out == ""
+
+    def test_signal_handlers_only_active_while_watching(self):
+        """Test that construction leaves handlers alone and watching restores them."""
+        handlers = signal.getsignal(signal.SIGINT), signal.getsignal(signal.SIGTERM)
+        seen = []
+
+        class _PeekingWatcher(_ListWatcher):
+            def watch_file_batches(self, file_path):
+                seen.append(signal.getsignal(signal.SIGINT))
+                yield from self.batches
+
+        usecase = FileWatchUseCase(_PeekingWatcher(["err"]), HybridPatternMatcher(), StandardOutputFormatter())
+        assert (signal.getsignal(signal.SIGINT), signal.getsignal(signal.SIGTERM)) == handlers
+
+        usecase.watch_and_search("watched.log", SearchOptions(patterns=[SearchPattern("err")], quiet=True))
+        assert seen == [usecase._signal_handler]
+        assert (signal.getsignal(signal.SIGINT), signal.getsignal(signal.SIGTERM)) == handlers
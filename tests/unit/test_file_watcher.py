@@ -0,0 +1,77 @@
+"""Tests for the polling file watcher."""
+
+import os
+import tempfile
+import threading
+import time
+
+from prep.infrastructure.file_watcher import StandardFileWatcher
+
+
+class TestStandardFileWatcher:
+    """Test StandardFileWatcher behavior."""
+
+    def setup_method(self):
+        """Create a file to watch."""
+        fd, self.file_path = tempfile.mkstemp()
+        os.write(fd, b"existing line\n")
+        os.close(fd)
+
+    def teardown_method(self):
+        """Remove the watched file."""
+        if os.path.exists(self.file_path):
+            os.remove(self.file_path)
+
+    def _later(self, action, delay: float = 0.2) -> None:
+        def run():
+            time.sleep(delay)
+            action()
+
+        threading.Thread(target=run, daemon=True).start()
+
+    def _append(self, data: bytes) -> None:
+        with open(self.file_path, 'ab') as file:
+            file.write(data)
+
+    def test_yields_appended_lines_after_idle_backoff(self):
+        """Test that new lines are picked up after the interval has backed off."""
+        watcher = StandardFileWatcher(poll_interval=0.01, max_poll_interval=0.1)
+        lines = watcher.watch_file(self.file_path)
+
+        self._later(lambda: self._append(b"first\npartial"), delay=0.3)
+        self._later(lambda: self._append(b" line\n"), delay=0.5)
+        assert next(lines) == "first"
+        assert next(lines) == "partial line"
+        lines.close()
+
+    def test_lines_of_one_write_arrive_as_one_batch(self):
+        """Test that lines read together are yielded together."""
+        watcher = StandardFileWatcher(poll_interval=0.01, max_poll_interval=0.05)
+        batches = watcher.watch_file_batches(self.file_path)
+
+        self._later(lambda: self._append(b"a\n\nb\nc"))
+        assert next(batches) == ["a", "b"]
+        batches.close()
+
+    def test_follows_recreated_file(self):
+        """Test that a replaced file is read from its beginning."""
+        watcher = StandardFileWatcher(poll_interval=0.01, max_poll_interval=0.05)
+        lines = watcher.watch_file(self.file_path)
+
+        def recreate():
+            replacement = self.file_path + ".new"
+            with open(replacement, 'wb') as file:
+                file.write(b"rotated\n")
+            os.replace(replacement, self.file_path)
+
+        self._later(recreate)
+        assert next(lines) == "rotated"
+        lines.close()
+
+    def test_stops_when_file_is_deleted(self):
+        """Test that deleting the watched file ends the watch."""
+        watcher = StandardFileWatcher(poll_interval=0.01, max_poll_interval=0.05)
+        lines = watcher.watch_file(self.file_path)
+
+        self._later(lambda: os.remove(self.file_path))
+        assert list(lines) == []
@@ -0,0 +1,86 @@
+"""Tests for the native inotify file watcher."""
+
+import os
+import tempfile
+import threading
+import time
+
+import pytest
+
+from prep.infrastructure.native_watcher import LinuxInotifyWatcher
+
+
+pytestmark = pytest.mark.skipif(
+    not LinuxInotifyWatcher.is_supported(), reason="inotify not available"
+)
+
+
+class TestLinuxInotifyWatcher:
+    """Test LinuxInotifyWatcher behavior."""
+
+    def setup_method(self):
+        """Create a file to watch."""
+        fd, self.file_path = tempfile.mkstemp()
+        os.write(fd, b"existing line\n")
+        os.close(fd)
+
+    def teardown_method(self):
+        """Remove the watched file."""
+        for path in (self.file_path, self.file_path + ".1"):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def _append_later(self, data: bytes, delay: float = 0.2) -> threading.Thread:
+        def append():
+            time.sleep(delay)
+            with open(self.file_path, 'ab') as file:
+                file.write(data)
+
+        thread = threading.Thread(target=append, daemon=True)
+        thread.start()
+        return thread
+
+    def test_yields_only_appended_lines(self):
+        """Test that existing content is skipped and new lines are yielded."""
+        watcher = LinuxInotifyWatcher(wakeup_interval=0.05)
+        lines = watcher.watch_file(self.file_path)
+
+        self._append_later(b"first\nsecond\n")
+        assert next(lines) == "first"
+        assert next(lines) == "second"
+        lines.close()
+
+    def test_partial_line_is_held_until_complete(self):
+        """Test that a line written in pieces is yielded once."""
+        watcher = LinuxInotifyWatcher(wakeup_interval=0.05)
+        lines = watcher.watch_file(self.file_path)
+
+        self._append_later(b"hel", delay=0.1)
+        self._append_later(b"lo\n", delay=0.3)
+        assert next(lines) == "hello"
+        lines.close()
+
+    def test_follows_rotated_file(self):
+        """Test that a moved-away file is drained and its replacement followed."""
+        watcher = LinuxInotifyWatcher(wakeup_interval=0.05)
+        lines = watcher.watch_file(self.file_path)
+
+        def rotate():
+            with open(self.file_path, 'ab') as file:
+                file.write(b"before rotation\n")
+            os.rename(self.file_path, self.file_path + ".1")
+            time.sleep(0.2)
+            with open(self.file_path, 'wb') as file:
+                file.write(b"rotated\n")
+
+        threading.Timer(0.2, rotate).start()
+        assert next(lines) == "before rotation"
+        assert next(lines) == "rotated"
+        lines.close()
+
+    def test_missing_file_raises(self):
+        """Test that watching a missing file raises FileNotFoundError."""
+        watcher = LinuxInotifyWatcher()
+
+        with pytest.raises(FileNotFoundError):
+            next(watcher.watch_file(self.file_path + ".missing"))
@@ -0,0 +1,99 @@
+"""Tests for output formatters."""
+
+from prep.domain.models import FileMatch, MatchResult, MatchTable, SearchOptions, SearchPattern, SearchResult
+from prep.infrastructure.output_formatting import (
+    HIGHLIGHT_END, HIGHLIGHT_START, CompactOutputFormatter, StandardOutputFormatter
+)
+
+
+def _highlight(line, *spans):
+    matches = [MatchResult(1, line, start, end, None) for start, end in spans]
+    return StandardOutputFormatter.highlight_matches(matches, line)
+
+
+def _marked(text):
+    return text.replace("[", HIGHLIGHT_START).replace("]", HIGHLIGHT_END)
+
+
+class TestHighlightMatches:
+    """Test ANSI highlighting of match spans."""
+
+    def test_spans_in_any_order(self):
+        """Test that unsorted spans are highlighted left to right."""
+        assert _highlight("abcdef", (4, 5), (0, 1)) == _marked("[a]bcd[e]f")
+
+    def test_overlapping_and_adjacent_spans_merge(self):
+        """Test that overlapping or touching spans become one highlight."""
+        assert _highlight("abcdef", (1, 3), (2, 4), (4, 5)) == _marked("a[bcde]f")
+
+    def test_empty_spans_are_ignored(self):
+        """Test that zero-width matches leave the line unchanged."""
+        assert _highlight("abc", (1, 1)) == "abc"
+
+    def test_single_span(self):
+        """Test the one-match path at the edges of the line."""
+        assert _highlight("abc", (0, 3)) == _marked("[abc]")
+        assert _highlight("abc", (2, 3)) == _marked("ab[c]")
+
+
+class TestGroupByLine:
+    """Test grouping of a file's matches into output lines."""
+
+    def test_ordered_and_unordered_input(self):
+        """Test that both input orders give the same ascending groups."""
+        matches = [MatchResult(n, "x", 0, 1, None) for n in (1, 1, 3)]
+        expected = [(1, matches[:2]), (3, matches[2:])]
+
+        assert StandardOutputFormatter._group_by_line(matches) == expected
+        assert StandardOutputFormatter._group_by_line(matches[::-1]) == [
+            (1, matches[1::-1]), (3, matches[2:])
+        ]
+
+
+class TestCompactOutputFormatter:
+    """Test CompactOutputFormatter output."""
+
+    def test_lists_and_tables_format_alike(self):
+        """Test that list- and table-backed file matches give the same lines."""
+        matches = [MatchResult(2, "b", 0, 1, None), MatchResult(7, "g", 0, 1, None)]
+        result = SearchResult([FileMatch("x.log", matches), FileMatch("y.log", MatchTable(matches))], 4, 2)
+
+        assert CompactOutputFormatter().format_result(result, SearchOptions(patterns=[])) == (
+            "x.log:2:b\nx.log:7:g\ny.log:2:b\ny.log:7:g"
+        )
+
+
+class TestIterFormatResult:
+    """Test line-by-line formatting of search results."""
+
+    def test_lines_join_to_format_result(self):
+        """Test that streamed lines match the joined output in every mode."""
+        pattern = SearchPattern("b")
+        result = SearchResult([
+            FileMatch("x.log", [MatchResult(2, "ab", 1, 2, pattern), MatchResult(2, "ab", 1, 2, pattern)]),
+            FileMatch("y.log", [MatchResult(5, "b", 0, 1, pattern)]),
+        ], 3, 2)
+        formatter = StandardOutputFormatter()
+
+        for options in (SearchOptions(patterns=[pattern]), SearchOptions(patterns=[pattern], count_only=True)):
+            lines = list(formatter.iter_format_result(result, options))
+            assert len(lines) == 2
+            assert "\n".join(lines) == formatter.format_result(result, options)
+        assert list(formatter.iter_format_result(result, SearchOptions(patterns=[pattern], quiet=True))) == []
+
+    def test_filename_prefix_only_for_several_files(self):
+        """Test that match lines carry the path exactly when several files matched."""
+        pattern = SearchPattern("b")
+        options = SearchOptions(patterns=[pattern])
+        formatter = StandardOutputFormatter()
+        x_log = FileMatch("x.log", [MatchResult(2, "ab", 1, 2, pattern)])
+        y_log = FileMatch("y.log", [MatchResult(5, "b", 0, 1, pattern)])
+
+        assert formatter.format_result(SearchResult([x_log], 1, 1), options) == "2:ab"
+        assert formatter.format_result(SearchResult([x_log, y_log], 2, 2), options) == "x.log:2:ab\ny.log:5:b"
+
+    def test_count_stream_skips_matches(self):
+        """Test that count output comes from the counts alone."""
+        result = SearchResult([FileMatch("x.log", [None, None]), FileMatch("y.log", [None])], 3, 2)
+
+        assert list(StandardOutputFormatter.format_count_result_stream(result)) == ["x.log:2", "y.log:1"]
@@ -0,0 +1,78 @@
+"""Tests for parallel executors."""
+
+import pickle
+
+import pytest
+
+from prep.infrastructure.parallel_execution import (
+    AdaptiveExecutor, SequentialExecutor, ThreadBasedExecutor, _PooledExecutor
+)
+
+
+class TestThreadBasedExecutor:
+    """Test ThreadBasedExecutor behavior."""
+
+    def test_pool_is_reused_across_calls(self):
+        """Test that one pool serves repeated calls with the same size."""
+        executor = ThreadBasedExecutor()
+        try:
+            assert executor.execute_map(abs, [-1, -2, -3], max_workers=2) == [1, 2, 3]
+            pool = executor._pool
+            assert sorted(executor.execute_parallel([lambda: 1, lambda: 2], max_workers=2)) == [1, 2]
+            assert executor._pool is pool
+        finally:
+            executor.shutdown()
+
+    def test_resize_and_shutdown(self):
+        """Test that a new size replaces the pool and shutdown releases it."""
+        executor = ThreadBasedExecutor()
+        executor.execute_map(abs, [-1], max_workers=1)
+        pool = executor._pool
+        executor.execute_map(abs, [-1], max_workers=3)
+        assert executor._pool is not pool
+
+        executor.shutdown()
+        assert executor._pool is None
+        assert executor.execute_map(abs, [-4]) == [4]
+        executor.shutdown()
+
+
+class TestAdaptiveExecutor:
+    """Test AdaptiveExecutor behavior."""
+
+    def test_pickles_after_use(self):
+        """Test that an executor with live pools can still be sent to workers."""
+        executor = AdaptiveExecutor()
+        try:
+            assert executor.execute_map(abs, list(range(-20, 0)), max_workers=2)[:2] == [20, 19]
+            copy = pickle.loads(pickle.dumps(executor))
+            assert copy._thread_executor._pool is None
+            assert copy.execute_map(abs, [-5]) == [5]
+        finally:
+            executor._thread_executor.shutdown()
+            executor._process_executor.shutdown()
+
+
+class TestSequentialExecutor:
+    """Test SequentialExecutor behavior."""
+
+    def test_failed_task_reported_on_stderr(self, capsys):
+        """Test that a failing task yields None and keeps stdout clean."""
+        assert SequentialExecutor().execute_map(int, ["1", "x"]) == [1, None]
+
+        captured = capsys.readouterr()
+        assert captured.out == ""
+        assert "invalid literal" in captured.err
+
+
+class TestPooledExecutor:
+    """Test the shared base of pooled executors."""
+
+    def test_subclass_without_pool_factory_cannot_be_created(self):
+        """Test that a missing _create_pool fails at instantiation, not on first use."""
+        class NoPool(_PooledExecutor):
+            def execute_map(self, func, items, max_workers=None):
+                return []
+
+        with pytest.raises(TypeError):
+            NoPool()
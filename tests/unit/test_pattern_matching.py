@@ -0,0 +1,166 @@
+"""Tests for pattern matcher implementations."""
+
+import re
+from unittest.mock import patch
+
+from prep.domain.models import SearchOptions, SearchPattern, MatchType
+from prep.infrastructure.boolean_parser import CompiledExpression
+from prep.infrastructure.pattern_matching import (
+    BooleanPatternMatcher, HybridPatternMatcher, RegexPatternMatcher
+)
+
+
+def _spans(pattern: SearchPattern, line: str):
+    options = SearchOptions(patterns=[pattern])
+    return [(m.match_start, m.match_end) for m in HybridPatternMatcher().find_matches(line, 1, options)]
+
+
+class TestFixedStringMatching:
+    """Test the fixed-string (-F) path of HybridPatternMatcher."""
+
+    def test_metacharacters_are_literal(self):
+        """Test that regex metacharacters match only themselves."""
+        assert _spans(SearchPattern("a.b", is_regex=False), "axb a.b") == [(4, 7)]
+
+    def test_alternatives_split_on_unescaped_bar(self):
+        """Test that '|' separates literals and '\\|' stays literal."""
+        assert sorted(_spans(SearchPattern("err|warn", is_regex=False), "warn err")) == [(0, 4), (5, 8)]
+        assert _spans(SearchPattern(r"a\|b", is_regex=False), "a|b") == [(0, 3)]
+
+    def test_repeated_occurrences_do_not_overlap(self):
+        """Test that plain substring search reports non-overlapping spans like finditer."""
+        assert _spans(SearchPattern("aa", is_regex=False), "aaaaa") == [(0, 2), (2, 4)]
+
+    def test_ignore_case(self):
+        """Test case-insensitive fixed-string matching."""
+        pattern = SearchPattern("Err", regex_flags=re.IGNORECASE, is_regex=False)
+        assert _spans(pattern, "ERR") == [(0, 3)]
+        # Lowercasing "İ" adds a character; spans must index the original line
+        assert _spans(pattern, "İx err") == [(3, 6)]
+
+    def test_word_and_line_match(self):
+        """Test word boundaries and whole-line matching without regex."""
+        assert _spans(SearchPattern("foo", MatchType.WORD, is_regex=False), "foo_bar foo") == [(8, 11)]
+        assert _spans(SearchPattern("x", MatchType.LINE, is_regex=False), "x") == [(0, 1)]
+        assert _spans(SearchPattern("x", MatchType.LINE, is_regex=False), "x y") == []
+
+
+class TestMatcherDispatch:
+    """Test how HybridPatternMatcher chooses a matcher per pattern."""
+
+    def test_plain_regex_skips_expression_tree(self):
+        """Test that operator-free regexes go straight to the regex matcher."""
+        matcher = HybridPatternMatcher()
+        assert isinstance(matcher._matcher_for(SearchPattern(r"err\w+")), RegexPatternMatcher)
+        assert isinstance(matcher._matcher_for(SearchPattern("a&b")), BooleanPatternMatcher)
+        assert isinstance(matcher._matcher_for(SearchPattern("  ")), BooleanPatternMatcher)
+
+    def test_invalid_regex_is_lenient(self):
+        """Test that an invalid operator-free regex matches nothing instead of raising."""
+        matcher = HybridPatternMatcher()
+        options = SearchOptions(patterns=[SearchPattern("foo(")])
+
+        assert isinstance(matcher._matcher_for(options.patterns[0]), BooleanPatternMatcher)
+        assert matcher.find_matches("foo(", 1, options) == []
+        assert not matcher.has_any_match("foo(", options)
+
+    def test_plan_groups_patterns_once(self):
+        """Test that patterns are grouped per matcher once per options object."""
+        matcher = HybridPatternMatcher()
+        options = SearchOptions(patterns=[SearchPattern("a"), SearchPattern("b&c"), SearchPattern("d")])
+
+        assert len(matcher.find_matches("a d", 1, options)) == 2
+        plan = matcher._last_plan[1]
+        matcher.find_matches("b c", 2, options)
+        assert matcher._last_plan[1] is plan
+        assert [[p.pattern for p in opts.patterns] for _, opts in plan] == [["a", "d"], ["b&c"]]
+
+    def test_plain_regex_spans(self):
+        """Test that the regex path still applies word matching."""
+        assert _spans(SearchPattern("fo+", MatchType.WORD), "foo fooz") == [(0, 3)]
+
+
+class TestBooleanPatternMatcher:
+    """Test BooleanPatternMatcher behavior."""
+
+    def test_highlighters_built_once_per_pattern(self):
+        """Test that literal regexes are prepared once and reused on later lines."""
+        matcher = BooleanPatternMatcher()
+        options = SearchOptions(patterns=[SearchPattern("err&!ok|warn")])
+
+        assert [(m.match_start, m.match_end) for m in matcher.find_matches("err", 1, options)] == [(0, 3)]
+        highlighters = matcher._highlighters[options.patterns[0]]
+        assert [hint for hint, _ in highlighters] == ["err", "ok", "warn"]
+        matcher.find_matches("warn", 2, options)
+        assert matcher._highlighters[options.patterns[0]] is highlighters
+
+    def test_literals_compiled_once_per_pattern(self):
+        """Test that evaluating many lines compiles each distinct literal once."""
+        matcher = BooleanPatternMatcher()
+        options = SearchOptions(patterns=[SearchPattern("(A|B)&C")])
+        lines = ["foo AC bar", "foo BC bar", "foo A bar", "foo B bar", "foo C bar", "A B C"]
+
+        with patch.object(CompiledExpression, "_compile_search", side_effect=CompiledExpression._compile_search) as compile_search:
+            assert [matcher.has_any_match(line, options) for line in lines] == [True, True, False, False, False, True]
+        assert compile_search.call_count == 3
+
+    def test_word_mode_highlights_whole_words(self):
+        """Test that highlight spans follow the match type applied to the tree."""
+        options = SearchOptions(patterns=[SearchPattern("fo+&!bar", MatchType.WORD)])
+
+        assert [(m.match_start, m.match_end) for m in BooleanPatternMatcher().find_matches("xfoo foo", 1, options)] == [(5, 8)]
+
+    def test_span_found_by_several_literals_reported_once(self):
+        """Test that literals matching the same text do not duplicate matches."""
+        options = SearchOptions(patterns=[SearchPattern("foo&(foo|f.o)")])
+        matches = BooleanPatternMatcher().find_matches("a foo", 1, options)
+
+        assert [(m.match_start, m.match_end) for m in matches] == [(2, 5)]
+
+
+class TestHasAnyMatch:
+    """Test the early-exit presence check used by -v, -c and -q."""
+
+    def test_agrees_with_find_matches(self):
+        """Test that has_any_match is true exactly when find_matches finds something."""
+        matcher = HybridPatternMatcher()
+        patterns = [
+            SearchPattern("err"), SearchPattern("a&!b"), SearchPattern("!zz"),
+            SearchPattern("x|y", is_regex=False), SearchPattern("foo", MatchType.WORD),
+        ]
+        for pattern in patterns:
+            options = SearchOptions(patterns=[pattern])
+            for line in ["err a", "ab", "zz", "y", "foobar", "foo bar", ""]:
+                expected = bool(matcher.find_matches(line, 1, options))
+                assert matcher.has_any_match(line, options) == expected, (pattern.pattern, line)
+
+
+class TestMayMatchBlock:
+    """Test the whole-block check used to skip blocks of lines."""
+
+    def test_rules_out_blocks_without_matches(self):
+        """Test that anchors apply per line and absent literals rule a block out."""
+        matcher = HybridPatternMatcher()
+        anchored = SearchOptions(patterns=[SearchPattern("^b")])
+        fixed = SearchOptions(patterns=[SearchPattern("Err", regex_flags=re.IGNORECASE, is_regex=False)])
+
+        assert matcher.may_match_block("a\nb", anchored)
+        assert not matcher.may_match_block("ab\nab", anchored)
+        assert matcher.may_match_block("ok\nERR", fixed)
+        assert not matcher.may_match_block("ok\nwarn", fixed)
+
+    def test_patterns_seeing_past_a_line_are_not_ruled_out(self):
+        """Test that lookarounds and string anchors fall back to per-line search."""
+        matcher = RegexPatternMatcher()
+        for pattern in [r"(?<!a)b", r"\Ab", r"a\s*+$"]:
+            options = SearchOptions(patterns=[SearchPattern(pattern)])
+            assert matcher.may_match_block("ab", options), pattern
+
+    def test_required_literal_rules_out_blocks(self):
+        """Test that a missing required literal rules a block out even without a block regex."""
+        matcher = RegexPatternMatcher()
+        options = SearchOptions(patterns=[SearchPattern(r"\d+ms timeout(?=\s)")])
+
+        assert not matcher.may_match_block("5ms\ntimeout", options)
+        assert matcher.may_match_block("x\n5ms timeout", options)
+        assert matcher._block_searches[options.patterns[0]][1] is None
@@ -0,0 +1,83 @@
+"""Tests for the search use cases."""
+
+import tempfile
+from pathlib import Path
+
+from prep.domain.models import SearchOptions, SearchPattern
+from prep.infrastructure.file_operations import StandardFileReader, StandardFileScanner
+from prep.infrastructure.parallel_execution import SequentialExecutor
+from prep.infrastructure.pattern_matching import HybridPatternMatcher
+from prep.usecases.search_usecase import CountUseCase, QuietUseCase, SearchUseCase
+
+
+class _RecordingExecutor(SequentialExecutor):
+    """Sequential executor that records the items of each execute_map call."""
+
+    def __init__(self):
+        self.calls = []
+
+    def execute_map(self, func, items, max_workers=None):
+        self.calls.append(list(items))
+        return super().execute_map(func, items, max_workers)
+
+
+class TestQuietUseCase:
+    """Test QuietUseCase behavior."""
+
+    def setup_method(self):
+        """Create files of which only the first one matches."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.paths = []
+        for index in range(20):
+            path = Path(self.temp_dir) / f"{index:02d}.log"
+            path.write_text("error here\n" if index == 0 else "all good\n")
+            self.paths.append(str(path))
+
+    def teardown_method(self):
+        """Clean up test files."""
+        import shutil
+        shutil.rmtree(self.temp_dir)
+
+    def test_parallel_search_stops_after_round_with_match(self):
+        """Test that later rounds of files are not searched once one matched."""
+        executor = _RecordingExecutor()
+        search = SearchUseCase(StandardFileReader(), StandardFileScanner(), HybridPatternMatcher(), executor)
+        options = SearchOptions(patterns=[SearchPattern("error")], max_threads=2)
+
+        assert QuietUseCase(search).execute(self.paths, options)
+        assert executor.calls == [self.paths[:8]]
+
+    def test_parallel_search_without_match_covers_all_files(self):
+        """Test that a quiet search without matches still searches every file."""
+        executor = _RecordingExecutor()
+        search = SearchUseCase(StandardFileReader(), StandardFileScanner(), HybridPatternMatcher(), executor)
+        options = SearchOptions(patterns=[SearchPattern("missing")], max_threads=2)
+
+        assert not QuietUseCase(search).execute(self.paths, options)
+        assert [path for call in executor.calls for path in call] == self.paths
+
+
+class TestCountUseCase:
+    """Test CountUseCase behavior."""
+
+    def setup_method(self):
+        """Create a file to count in."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = str(Path(self.temp_dir) / "app.log")
+        Path(self.path).write_text("error one\nok\nerror two\nfine\n")
+
+    def teardown_method(self):
+        """Clean up test files."""
+        import shutil
+        shutil.rmtree(self.temp_dir)
+
+    def test_counts_selected_lines_without_keeping_them(self):
+        """Test that counting records line numbers but not line text."""
+        search = SearchUseCase(StandardFileReader(), StandardFileScanner(), HybridPatternMatcher())
+        options = SearchOptions(patterns=[SearchPattern("error")], invert_match=True)
+
+        result = CountUseCase(search).execute([self.path], options)
+        matches = result.file_matches[0].matches
+        assert result.total_matches == 2
+        assert [m.line_number for m in matches] == [2, 4]
+        assert [m.line_content for m in matches] == ["", ""]